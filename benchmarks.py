@@ -0,0 +1,116 @@
+import argparse
+import time
+
+from scene import *
+
+def get_temperature_sweep(duration, frame_rate):
+    # Same sweep as CurrentInSuperconductor: down to 0.1 and back up to 3
+    num_of_frames = int(duration * frame_rate)
+    half = num_of_frames // 2
+    return np.concatenate([
+        np.linspace(3, 0.1, half),
+        np.linspace(0.1, 3, num_of_frames - half)
+    ])
+
+def time_updater(updater, temperatures):
+    frame_times = np.empty(len(temperatures))
+    for frame, temperature in enumerate(temperatures):
+        start_time = time.perf_counter()
+        updater(temperature)
+        frame_times[frame] = time.perf_counter() - start_time
+    return frame_times
+
+def benchmark_current_carrier(duration=10, frame_rate=60):
+    # Same resistivity model as CurrentInSuperconductor
+    func = SuperconductorResistivity(
+        NormalMetalResistivity(residual_resistivity=1.5, coupling=2.8, debye_temperature=1.5), critical_temperature=0.5
+    )
+
+    wire_loop = Circle(radius=0.7, color=WHITE).shift(1.75 * DOWN)
+    temperatures = get_temperature_sweep(duration, frame_rate)
+
+    current_dot = CurrentCarrier(wire_loop.get_center(), wire_loop.radius)
+    carrier_times = time_updater(
+        lambda temperature: current_dot.follow_temperature(temperature, func(temperature), critical_temperature=func.critical_temperature, dt=1 / frame_rate),
+        temperatures
+    )
+
+    # The become based updater CurrentInSuperconductor used before
+    legacy_dot = Circle(color=BLUE, radius=0.08, fill_opacity=1).move_to(wire_loop.get_center() + wire_loop.radius * UP)
+
+    def legacy_updater(temperature):
+        if temperature <= func.critical_temperature:
+            legacy_dot.become(Circle(radius=0.7, color=BLUE, fill_opacity=0).move_to(wire_loop.get_center()))
+        else:
+            if legacy_dot.get_center()[0] == wire_loop.get_center()[0]:
+                legacy_dot.become(Circle(color=BLUE, radius=0.08, fill_opacity=1)).move_to(wire_loop.get_center() + wire_loop.radius * UP)
+            legacy_dot.rotate(1.0 / func(temperature), about_point=wire_loop.get_center())
+
+    legacy_times = time_updater(legacy_updater, temperatures)
+
+    print(f"Updater cost per frame over a {duration}s sweep at {frame_rate} fps (microseconds)")
+    print(f"{'second':>6} {'temperature':>12} {'CurrentCarrier':>15} {'become':>10}")
+    for second in range(duration):
+        frames = slice(second * frame_rate, (second + 1) * frame_rate)
+        print(
+            f"{second:>6} {temperatures[frames].mean():>12.2f} "
+            f"{1e6 * carrier_times[frames].mean():>15.1f} {1e6 * legacy_times[frames].mean():>10.1f}"
+        )
+
+def get_magnet_array_sources(num_of_sources, seed=0):
+    # Aligned dipoles scattered over the frame, like a magnet array split into small domains
+    rng = np.random.default_rng(seed)
+    num_of_dipoles = max(num_of_sources // 2, 1)
+    centers = rng.uniform(-5, 5, (num_of_dipoles, 3)) * [1, 0.6, 0]
+    separation = 0.05 * RIGHT
+    strength = 100 / num_of_dipoles
+    return [(center + separation, +strength) for center in centers] + [(center - separation, -strength) for center in centers]
+
+def get_direct_field(points, point_strength_pairs, radius=0.5, chunk_size=64):
+    # Chunked over points so the (N, M, 3) offsets stay small at 100k sources
+    centers = np.array([center for center, strength in point_strength_pairs])
+    strengths = np.array([strength for center, strength in point_strength_pairs])
+    return np.concatenate([
+        get_force_field_batch(points[start:start + chunk_size], centers, strengths, radius)
+        for start in range(0, len(points), chunk_size)
+    ])
+
+def benchmark_barnes_hut(source_counts=(10, 100, 1000, 10000, 100000), thetas=(0.3, 0.5, 0.8)):
+    points = get_field_grid_points()
+
+    print(f"Barnes-Hut against the direct sum on the {len(points)} point frame grid")
+    print(f"{'sources':>8} {'direct ms':>10} {'build ms':>9} {'theta':>6} {'eval ms':>8} {'speedup':>8} {'rel error':>10}")
+    for num_of_sources in source_counts:
+        point_strength_pairs = get_magnet_array_sources(num_of_sources)
+
+        start_time = time.perf_counter()
+        direct_values = get_direct_field(points, point_strength_pairs)
+        direct_time = time.perf_counter() - start_time
+
+        for theta in thetas:
+            start_time = time.perf_counter()
+            func = get_barnes_hut_field_func(*point_strength_pairs, theta=theta)
+            build_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            values = func.batch(points)
+            evaluation_time = time.perf_counter() - start_time
+
+            error = np.linalg.norm(values - direct_values) / np.linalg.norm(direct_values)
+            print(
+                f"{len(point_strength_pairs):>8} {1e3 * direct_time:>10.1f} {1e3 * build_time:>9.1f} {theta:>6.2f} "
+                f"{1e3 * evaluation_time:>8.1f} {direct_time / evaluation_time:>8.1f} {error:>10.2e}"
+            )
+
+BENCHMARKS = {
+    "current_carrier": benchmark_current_carrier,
+    "barnes_hut": benchmark_barnes_hut,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro benchmarks for the flux pinning scenes")
+    parser.add_argument("benchmarks", nargs="*", choices=sorted(BENCHMARKS), default=sorted(BENCHMARKS))
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+        BENCHMARKS[name]()
@@ -0,0 +1,453 @@
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import importlib
+import inspect
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+import types
+
+import numpy as np
+
+from manim import Camera, Scene, ThreeDCamera, ThreeDScene, config, tempconfig
+from manim.renderer import cairo_renderer
+from manim.renderer.cairo_renderer import CairoRenderer
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+class HeldFrameRenderer(CairoRenderer):
+    # Only rasterizes a frame when something visible changed since the last one, so
+    # waits and animations whose updaters leave everything in place hold a single frame
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frame_fingerprint = None
+        self.num_of_held_frames = 0
+
+    def get_frame_fingerprint(self, scene):
+        fingerprint = hashlib.blake2b(digest_size=16)
+
+        # A ThreeDCamera can turn or zoom without any mobject in the scene changing
+        camera_state = [self.camera.frame_center]
+        if hasattr(self.camera, "get_value_trackers"):
+            camera_state += [tracker.get_value() for tracker in self.camera.get_value_trackers()]
+        fingerprint.update(np.hstack(camera_state).astype(float).data)
+
+        for mobject in scene.get_mobject_family_members():
+            fingerprint.update(f"{id(mobject)}:{mobject.z_index}".encode())
+            for attribute in ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width", "background_stroke_width", "rgbas", "pixel_array"):
+                value = getattr(mobject, attribute, None)
+                if value is not None:
+                    fingerprint.update(np.ascontiguousarray(value).data)
+        return fingerprint.digest()
+
+    def update_frame(self, *args, **kwargs):
+        # Any frame drawn outside render(), such as the static background of a new
+        # animation, leaves the camera out of step with the last fingerprint
+        super().update_frame(*args, **kwargs)
+        self.frame_fingerprint = None
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            # A skipped play stepped frame by frame writes nothing, so leave the camera
+            # and the held frame as they are
+            return
+
+        fingerprint = self.get_frame_fingerprint(scene)
+        if fingerprint == self.frame_fingerprint:
+            self.num_of_held_frames += 1
+        else:
+            self.update_frame(scene, moving_mobjects)
+            self.frame_fingerprint = fingerprint
+        self.add_frame(self.get_frame())
+
+def get_renderer(scene_class):
+    # Manim only builds the camera from a scene's camera_class when it makes the renderer
+    # itself, so one passed in has to bring the camera the scene would have picked
+    return HeldFrameRenderer(camera_class=ThreeDCamera if issubclass(scene_class, ThreeDScene) else Camera)
+
+LIBRARY_PATHS = tuple({sysconfig.get_paths()[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+# Scene bookkeeping that changes on every play call without changing what it draws
+SCENE_INTERNALS = {
+    "renderer", "camera", "mobjects", "foreground_mobjects", "moving_mobjects", "static_mobjects", "animations",
+    "time_progression", "duration", "time", "last_t", "stop_condition", "queue", "updaters"
+}
+
+def is_user_code(value):
+    module = sys.modules.get(getattr(value, "__module__", None) or "")
+    path = getattr(module, "__file__", None)
+    return path is not None and not os.path.abspath(path).startswith(LIBRARY_PATHS)
+
+def get_global_names(code):
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= get_global_names(constant)
+    return names
+
+def is_mutable_cache(name, value):
+    # Module and class level dicts, lists and sets that are not UPPER_CASE constants are
+    # memos filled while rendering (glyph_cache, BarMagnetSource.field_memo); hashing them
+    # would change the hash of a play call once an earlier one warmed them up
+    return isinstance(value, (dict, list, set, bytearray)) and not name.isupper()
+
+class Fingerprint:
+    # Hashes what a value would compute rather than how manim's JSON encoder sees it:
+    # full array contents, closure cells, bytecode, and the helpers a function calls
+    # from this repository, so an edit to get_force_field_batch reaches every play
+    # call whose field func ends up using it
+    def __init__(self):
+        self.digest = hashlib.blake2b(digest_size=8)
+        self.memo = {}
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+    def write(self, *tokens):
+        for token in tokens:
+            self.digest.update(str(token).encode())
+            self.digest.update(b"\0")
+
+    def update(self, value):
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            self.write(type(value).__name__, repr(value))
+            return self
+        if isinstance(value, np.generic):
+            self.write(value.dtype, repr(value))
+            return self
+        if isinstance(value, np.ndarray):
+            self.write("ndarray", value.dtype, value.shape)
+            self.digest.update(np.ascontiguousarray(value).data if value.dtype != object else repr(value.tolist()).encode())
+            return self
+
+        # Shared and self referencing objects are hashed once, later visits only by order
+        if id(value) in self.memo:
+            self.write("ref", self.memo[id(value)][0])
+            return self
+        self.memo[id(value)] = (len(self.memo), value)
+
+        if isinstance(value, (list, tuple)):
+            self.write(type(value).__name__, len(value))
+            for item in value:
+                self.update(item)
+        elif isinstance(value, (set, frozenset)):
+            # Set order depends on the process' hash seed
+            self.write(type(value).__name__, len(value))
+            for item_digest in sorted(Fingerprint().update(item).hexdigest() for item in value):
+                self.write(item_digest)
+        elif isinstance(value, dict):
+            self.write("dict", len(value))
+            for key, item in value.items():
+                self.update(key)
+                self.update(item)
+        elif isinstance(value, types.ModuleType):
+            self.write("module", value.__name__)
+        elif isinstance(value, functools.partial):
+            self.write("partial")
+            self.update(value.func).update(value.args).update(value.keywords)
+        elif isinstance(value, types.MethodType):
+            self.write("method")
+            self.update(value.__func__).update(value.__self__)
+        elif isinstance(value, types.FunctionType):
+            self.update_function(value)
+        elif isinstance(value, type):
+            self.update_class(value)
+        elif hasattr(value, "__wrapped__") and callable(value):
+            self.write("wrapper")
+            self.update(value.__wrapped__)
+        elif isinstance(value, types.CodeType):
+            self.update_code(value)
+        elif isinstance(value, type(config)):
+            # Quality and frame rate already reach the hash through the camera and the
+            # partial movie directory; the rest names files and scenes
+            self.write("config")
+        elif isinstance(value, Scene):
+            self.write("scene", type(value).__qualname__)
+            self.update({name: item for name, item in vars(value).items() if name not in SCENE_INTERNALS and not name.startswith("_")})
+        elif callable(value) and not hasattr(value, "__dict__"):
+            self.write("callable", getattr(value, "__module__", None), getattr(value, "__qualname__", type(value).__qualname__))
+        else:
+            self.write("object")
+            self.update(type(value))
+            self.update(getattr(value, "__dict__", {}))
+            for name in getattr(type(value), "__slots__", ()):
+                self.update(getattr(value, name, None))
+        return self
+
+    def update_code(self, code):
+        self.write("code", code.co_name, code.co_argcount, code.co_kwonlyargcount, code.co_flags, code.co_names, code.co_varnames)
+        self.digest.update(code.co_code)
+        for constant in code.co_consts:
+            self.update(constant)
+
+    def update_function(self, function):
+        self.write("function", function.__module__, function.__qualname__)
+        if not is_user_code(function):
+            return
+
+        self.update_code(function.__code__)
+        self.update(function.__defaults__).update(function.__kwdefaults__)
+        self.update([cell.cell_contents for cell in function.__closure__ or () if cell.cell_contents is not None])
+        self.update(function.__dict__)
+
+        for name in sorted(get_global_names(function.__code__)):
+            if name in function.__globals__ and not is_mutable_cache(name, function.__globals__[name]):
+                self.write(name)
+                self.update(function.__globals__[name])
+
+    def update_class(self, cls):
+        self.write("class", cls.__module__, cls.__qualname__)
+        if not is_user_code(cls):
+            return
+
+        for base in cls.__bases__:
+            self.update(base)
+        for name, member in vars(cls).items():
+            if is_mutable_cache(name, member):
+                continue
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            if isinstance(member, property):
+                member = member.fget
+            if isinstance(member, types.FunctionType) or not name.startswith("__"):
+                self.write(name)
+                self.update(member)
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list, *args, **kwargs):
+    # Newer manim releases also pass backend, encoder_fingerprint and renderer_state;
+    # a different encoder writes different partial movies, so they join the hash too
+    camera_state = (
+        camera_object.pixel_width, camera_object.pixel_height, camera_object.frame_width, camera_object.frame_height,
+        camera_object.frame_center, str(camera_object.background_color), camera_object.background_opacity, config["frame_rate"]
+    )
+    play_hash = "_".join(
+        Fingerprint().update(value).hexdigest()
+        for value in (camera_state, list(animations_list), list(current_mobjects_list))
+    )
+    if args or kwargs:
+        play_hash += "_" + Fingerprint().update(list(args)).update(sorted(kwargs.items())).hexdigest()
+    return play_hash
+
+def install_fingerprint_hashing():
+    # Partial movie names come from this hash, so swapping it in is all the cache needs
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+
+def get_scene_classes(module):
+    # Declaration order, skipping bases like SuperconductorScene that never construct anything
+    return [
+        value for value in vars(module).values()
+        if inspect.isclass(value) and issubclass(value, Scene) and value.__module__ == module.__name__
+        and "construct" in vars(value)
+    ]
+
+def get_render_groups(scene_classes):
+    # Scenes in the same partial movie group share a partial movie directory, so they
+    # render one after another in the same worker instead of racing on the same segments
+    groups = {}
+    for scene_class in scene_classes:
+        key = getattr(scene_class, "partial_movie_group", None) or scene_class.__name__
+        groups.setdefault(key, []).append(scene_class.__name__)
+    return list(groups.values())
+
+def render_scenes(module_name, scene_names, config_overrides):
+    install_fingerprint_hashing()
+    module = importlib.import_module(module_name)
+    results = []
+    for scene_name in scene_names:
+        with tempconfig(config_overrides):
+            start_time = time.perf_counter()
+            scene_class = getattr(module, scene_name)
+            scene = scene_class(renderer=get_renderer(scene_class))
+            cached_movies = get_partial_movie_files(scene)
+            scene.render()
+            play_hashes = [play_hash for play_hash in scene.renderer.animations_hashes if play_hash]
+            num_of_reused = sum(f"{play_hash}{config['movie_file_extension']}" in cached_movies for play_hash in play_hashes)
+            results.append((scene_name, str(scene.renderer.file_writer.movie_file_path), time.perf_counter() - start_time, num_of_reused, len(play_hashes)))
+    return results
+
+def get_partial_movie_files(scene):
+    directory = getattr(scene.renderer.file_writer, "partial_movie_directory", None)
+    if config["disable_caching"] or not directory or not os.path.isdir(directory):
+        return set()
+    return set(os.listdir(directory))
+
+def check_intro_reuse(render_groups, results):
+    # Every scene after the first in a partial movie group should pick its intro up from
+    # the shared partial movie directory instead of rendering it again
+    if config["disable_caching"]:
+        return
+    for group in render_groups:
+        for scene_name in group[1:]:
+            num_of_reused, num_of_plays = results[scene_name][2:]
+            if num_of_plays and not num_of_reused:
+                print(f"warning: {scene_name} reused none of the partial movies rendered by {group[0]}")
+
+def concatenate_movies(movie_paths, output_path):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file_list:
+        for movie_path in movie_paths:
+            file_list.write(f"file '{os.path.abspath(movie_path)}'\n")
+
+    try:
+        subprocess.run(
+            [shutil.which("ffmpeg") or "ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", file_list.name, "-c", "copy", output_path],
+            check=True
+        )
+    finally:
+        os.remove(file_list.name)
+
+def render_batch(module_name="scene", scene_names=None, workers=None, config_overrides=None, output_path=None):
+    module = importlib.import_module(module_name)
+    scene_classes = get_scene_classes(module)
+    if scene_names:
+        scene_classes = [scene_class for scene_class in scene_classes if scene_class.__name__ in scene_names]
+
+    config_overrides = config_overrides or {}
+    render_groups = get_render_groups(scene_classes)
+    num_of_scenes = len(scene_classes)
+
+    start_time = time.perf_counter()
+    results = {}
+
+    # Spawned workers start from a clean manim config instead of a copy of this one
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(render_scenes, module_name, group, config_overrides) for group in render_groups]
+        for future in concurrent.futures.as_completed(futures):
+            for scene_name, movie_path, duration, num_of_reused, num_of_plays in future.result():
+                results[scene_name] = (movie_path, duration, num_of_reused, num_of_plays)
+                print(f"[{len(results)}/{num_of_scenes}] {scene_name} rendered in {duration:.1f}s, {num_of_reused}/{num_of_plays} plays cached")
+
+    total_time = time.perf_counter() - start_time
+    scene_time = sum(result[1] for result in results.values())
+
+    print()
+    print(f"{'scene':<40} {'seconds':>10}")
+    for scene_class in scene_classes:
+        print(f"{scene_class.__name__:<40} {results[scene_class.__name__][1]:>10.1f}")
+    print(f"{'total (wall clock)':<40} {total_time:>10.1f}")
+    print(f"{'total (summed over scenes)':<40} {scene_time:>10.1f}")
+
+    with tempconfig(config_overrides):
+        check_intro_reuse(render_groups, results)
+
+    if output_path:
+        concatenate_movies([results[scene_class.__name__][0] for scene_class in scene_classes], output_path)
+        print(f"\nWrote {output_path}")
+
+    return results
+
+def get_animation_durations(module_name, scene_name, config_overrides):
+    # Dry run: every play call updates the mobjects but nothing is rasterized or written.
+    # dry_run only turns off the file writer, so skipping is switched on by hand
+    module = importlib.import_module(module_name)
+    durations = []
+    with tempconfig({**config_overrides, "dry_run": True}):
+        scene = getattr(module, scene_name)()
+        scene.renderer._original_skipping_status = scene.renderer.skip_animations = True
+        play = scene.renderer.play
+
+        def timed_play(scene, *args, **kwargs):
+            play(scene, *args, **kwargs)
+            durations.append(scene.duration)
+
+        scene.renderer.play = timed_play
+        scene.render()
+    return durations
+
+def get_segments(durations, num_of_segments):
+    # Contiguous ranges of play calls with roughly equal run time each
+    end_times = np.cumsum(durations)
+    targets = end_times[-1] * np.arange(1, num_of_segments) / num_of_segments
+    boundaries = np.unique(np.concatenate([[0], np.searchsorted(end_times, targets) + 1, [len(durations)]]))
+    return [(int(start), int(stop)) for start, stop in zip(boundaries[:-1], boundaries[1:]) if start < stop]
+
+def step_skipped_plays(scene):
+    # Manim runs a skipped play as one step, handing updaters a single dt as long as the
+    # whole play. Stepping at the frame rate instead, still without rasterizing, calls every
+    # updater exactly as a full render would, so counters and integrated positions match
+    get_time_progression = scene.get_time_progression
+
+    def stepped_time_progression(run_time, *args, **kwargs):
+        return get_time_progression(run_time, *args, **{**kwargs, "override_skip_animations": True})
+
+    scene.get_time_progression = stepped_time_progression
+    return scene
+
+def render_segment(module_name, scene_name, segment_index, start, stop, config_overrides):
+    # Each worker replays the scene without rasterizing up to its first play call, so
+    # it reaches the same mobject state before rendering its own range
+    module = importlib.import_module(module_name)
+    segment_config = {
+        **config_overrides,
+        "from_animation_number": start,
+        "upto_animation_number": stop - 1,
+        "output_file": f"{scene_name}_segment_{segment_index:03d}",
+        "partial_movie_dir": os.path.join("{video_dir}", "partial_movie_files", "{scene_name}", f"segment_{segment_index:03d}"),
+        "disable_caching": True,
+    }
+    with tempconfig(segment_config):
+        start_time = time.perf_counter()
+        scene_class = getattr(module, scene_name)
+        scene = step_skipped_plays(scene_class(renderer=get_renderer(scene_class)))
+        scene.render()
+        return segment_index, str(scene.renderer.file_writer.movie_file_path), time.perf_counter() - start_time
+
+def render_segmented(module_name, scene_name, num_of_segments=None, workers=None, config_overrides=None, output_path=None):
+    config_overrides = config_overrides or {}
+    num_of_segments = num_of_segments or os.cpu_count()
+
+    start_time = time.perf_counter()
+    durations = get_animation_durations(module_name, scene_name, config_overrides)
+    segments = get_segments(durations, num_of_segments)
+    print(f"{scene_name}: {len(durations)} play calls, {sum(durations):.1f}s, {len(segments)} segments (dry run {time.perf_counter() - start_time:.1f}s)")
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(render_segment, module_name, scene_name, segment_index, start, stop, config_overrides)
+            for segment_index, (start, stop) in enumerate(segments)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            segment_index, movie_path, duration = future.result()
+            results[segment_index] = movie_path
+            start, stop = segments[segment_index]
+            print(f"[{len(results)}/{len(segments)}] play calls {start}-{stop - 1} rendered in {duration:.1f}s")
+
+    output_path = output_path or os.path.join(config["media_dir"], f"{scene_name}.mp4")
+    concatenate_movies([results[segment_index] for segment_index in range(len(segments))], output_path)
+    print(f"\nWrote {output_path} in {time.perf_counter() - start_time:.1f}s")
+
+    return output_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every scene of a module in parallel and join them in declaration order")
+    parser.add_argument("scenes", nargs="*", help="scene names to render, all of them by default")
+    parser.add_argument("--module", default="scene")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-s", "--segments", type=int, default=None, help="split a single scene into this many segments rendered in parallel")
+    parser.add_argument("-o", "--output", default=None, help="final video, defaults to <media_dir>/<module or scene>.mp4")
+    args = parser.parse_args()
+
+    config_overrides = {"quality": QUALITIES[args.quality]}
+    if args.segments:
+        if len(args.scenes) != 1:
+            parser.error("--segments renders exactly one scene")
+        render_segmented(args.module, args.scenes[0], args.segments, args.workers, config_overrides, args.output)
+    else:
+        output_path = args.output or os.path.join(config["media_dir"], f"{args.module}.mp4")
+        render_batch(args.module, args.scenes, args.workers, config_overrides, output_path)
@@ -1,31 +1,640 @@
 from manim import *
 
+import ast
+import concurrent.futures
+import functools
+import hashlib
+import heapq
+import inspect
+import itertools
+import os
+import textwrap
+
+from scipy.interpolate import RegularGridInterpolator
+from scipy.signal import oaconvolve
+from scipy.special import k0, k1
+
+def get_force_field_batch(points, centers, strengths, radius=0.5):
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    strengths = np.asarray(strengths, dtype=float).reshape(-1)
+
+    # (N, M, 3) offsets from every point to every source
+    to_center = centers[np.newaxis, :, :] - points[:, np.newaxis, :]
+    norm = np.linalg.norm(to_center, axis=2)
+
+    # Softened core inside radius, sources sitting exactly on a point are skipped
+    with np.errstate(divide="ignore"):
+        scale = np.maximum(norm, radius) ** -3.0
+    scale = np.where(norm == 0, 0.0, scale)
+
+    return -np.einsum("nm,nmk->nk", scale * strengths, to_center)
+
+def get_pole_face_batch(points, starts, ends, strengths, softening=0.05):
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+
+    # Each face is a segment carrying its strength spread evenly along it. The same
+    # 1/r^2 kernel, Plummer softened, integrates in closed form along the segment
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    along = (ends - starts) / lengths[:, np.newaxis]
+    densities = np.asarray(strengths, dtype=float).reshape(-1) / lengths
+
+    # (N, M) coordinates of every point along and across every face
+    from_start = points[:, np.newaxis, :] - starts[np.newaxis, :, :]
+    s = np.einsum("nmk,mk->nm", from_start, along)
+    across = from_start - s[:, :, np.newaxis] * along[np.newaxis, :, :]
+    across_squared = np.einsum("nmk,nmk->nm", across, across) + softening**2
+
+    start_distance = np.sqrt(s**2 + across_squared)
+    end_distance = np.sqrt((s - lengths)**2 + across_squared)
+
+    along_component = densities * (1 / end_distance - 1 / start_distance)
+    across_component = densities * ((lengths - s) / end_distance + s / start_distance) / across_squared
+
+    return np.einsum("nm,mk->nk", along_component, along) + np.einsum("nm,nmk->nk", across_component, across)
+
 def get_force_field_func(*point_strength_pairs, **kwargs):
     radius = kwargs.get("radius", 0.5)
 
+    # Extended sources such as BarMagnetSource evaluate themselves
+    extended_sources = [source for source in point_strength_pairs if hasattr(source, "get_field")]
+    point_sources = [source for source in point_strength_pairs if not hasattr(source, "get_field")]
+
+    centers = np.array([center for center, strength in point_sources], dtype=float).reshape(-1, 3)
+    strengths = np.array([strength for center, strength in point_sources], dtype=float)
+
+    def batch(points):
+        values = get_force_field_batch(points, centers, strengths, radius)
+        for source in extended_sources:
+            values += source.get_field(points)
+        return values
+
     def func(point):
-        result = np.array(ORIGIN)
-        for center, strength in point_strength_pairs:
-            to_center = center - point
-            norm = np.linalg.norm(to_center)
-            if norm == 0:
+        return batch(point)[0]
+
+    func.batch = batch
+    func.point_strength_pairs = point_strength_pairs
+    func.radius = radius
+    return func
+
+class BarnesHutTree:
+    # Quadtree over the sources in the xy plane. Every node keeps the total strength
+    # and dipole moment of its sources about the node's center, so a whole node can
+    # stand in for its sources once it is small compared to its distance
+    def __init__(self, centers, strengths, leaf_size=32, max_depth=32):
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        strengths = np.asarray(strengths, dtype=float).reshape(-1)
+
+        self.leaf_size = leaf_size
+        self.max_depth = max_depth
+        self.node_centers = []
+        self.node_half_sizes = []
+        self.node_slices = []
+        self.node_children = []
+
+        lower, upper = centers[:, :2].min(axis=0), centers[:, :2].max(axis=0)
+        root_center = np.append((lower + upper) / 2, 0)
+        root_half_size = max((upper - lower).max() / 2, 1e-9)
+
+        order = []
+        self.build(centers, np.arange(len(centers)), root_center, root_half_size, 0, order)
+
+        # Sources are stored in tree order so every node owns a contiguous slice
+        self.centers = centers[order]
+        self.strengths = strengths[order]
+        self.node_centers = np.array(self.node_centers)
+        self.node_half_sizes = np.array(self.node_half_sizes)
+
+        self.node_strengths = np.array([self.strengths[start:stop].sum() for start, stop in self.node_slices])
+        self.node_dipoles = np.array([
+            self.strengths[start:stop] @ (self.centers[start:stop] - node_center)
+            for (start, stop), node_center in zip(self.node_slices, self.node_centers)
+        ]).reshape(-1, 3)
+
+    def build(self, centers, indices, center, half_size, depth, order):
+        node = len(self.node_centers)
+        self.node_centers.append(center)
+        self.node_half_sizes.append(half_size)
+        self.node_slices.append(None)
+        self.node_children.append([])
+
+        start = len(order)
+        if len(indices) <= self.leaf_size or depth == self.max_depth:
+            order.extend(indices)
+        else:
+            quadrants = (centers[indices, 0] >= center[0]) + 2 * (centers[indices, 1] >= center[1])
+            for quadrant in range(4):
+                child_indices = indices[quadrants == quadrant]
+                if len(child_indices) == 0:
+                    continue
+                offset = np.array([1 if quadrant & 1 else -1, 1 if quadrant & 2 else -1, 0]) * half_size / 2
+                self.node_children[node].append(
+                    self.build(centers, child_indices, center + offset, half_size / 2, depth + 1, order)
+                )
+        self.node_slices[node] = (start, len(order))
+        return node
+
+    def get_field(self, points, radius=0.5, theta=0.5):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        values = np.zeros_like(points)
+
+        # Walk the tree with every point at once; points that see a node under the
+        # opening angle theta take its multipole, the rest move on to its children.
+        # Nodes straddling a point's softened core are always opened
+        stack = [(0, np.arange(len(points)))]
+        while stack:
+            node, indices = stack.pop()
+            offsets = points[indices] - self.node_centers[node]
+            distances = np.linalg.norm(offsets, axis=1)
+            node_radius = np.sqrt(2) * self.node_half_sizes[node]
+            far = (2 * self.node_half_sizes[node] < theta * distances) & (
+                (distances - node_radius > radius) | (distances + node_radius < radius)
+            )
+
+            for accepted in (far & (distances < radius), far & (distances >= radius)):
+                if accepted.any():
+                    values[indices[accepted]] += self.get_multipole_field(node, offsets[accepted], distances[accepted], radius)
+
+            near = indices[~far]
+            if len(near) == 0:
                 continue
-            elif norm < radius:
-                to_center /= radius**3
-            elif norm >= radius:
-                to_center /= norm**3
-            to_center *= -strength
-            result += to_center
-        return result
+
+            if self.node_children[node]:
+                stack.extend((child, near) for child in self.node_children[node])
+            else:
+                start, stop = self.node_slices[node]
+                values[near] += get_force_field_batch(points[near], self.centers[start:stop], self.strengths[start:stop], radius)
+
+        return values
+
+    def get_multipole_field(self, node, offsets, distances, radius):
+        distances = distances[:, np.newaxis]
+        dipole = self.node_dipoles[node]
+
+        # Inside the softened core the kernel is linear, so the two terms are exact
+        if distances[0] < radius:
+            return (self.node_strengths[node] * offsets - dipole) / radius**3
+
+        monopole_field = self.node_strengths[node] * offsets / distances**3
+        dipole_field = 3 * offsets * (offsets @ dipole)[:, np.newaxis] / distances**5 - dipole / distances**3
+        return monopole_field + dipole_field
+
+def get_barnes_hut_field_func(*point_strength_pairs, **kwargs):
+    # Same field as get_force_field_func, approximated in O(log M) per point;
+    # smaller theta opens more nodes and trades speed for accuracy
+    radius = kwargs.get("radius", 0.5)
+    theta = kwargs.get("theta", 0.5)
+
+    centers = np.array([center for center, strength in point_strength_pairs], dtype=float).reshape(-1, 3)
+    strengths = np.array([strength for center, strength in point_strength_pairs], dtype=float)
+    leaf_size = kwargs.get("leaf_size", 32)
+    tree = BarnesHutTree(centers, strengths, leaf_size=leaf_size)
+
+    def batch(points):
+        return tree.get_field(points, radius, theta)
+
+    def func(point):
+        return batch(point)[0]
+
+    func.batch = batch
+    func.point_strength_pairs = point_strength_pairs
+    func.radius = radius
+    func.theta = theta
+
+    # Keeps its approximate grids apart from exact ones, and from other thetas, in the cache
+    func.evaluator = ("barnes_hut", theta, leaf_size)
     return func
 
-class MakeBarMagnet(Scene):
+def get_field_grid_points(x_range=None, y_range=None, step=0.5):
+    # Same sampling grid ArrowVectorField builds by default
+    x_range = x_range or [np.floor(-config["frame_width"] / 2), np.ceil(config["frame_width"] / 2)]
+    y_range = y_range or [np.floor(-config["frame_height"] / 2), np.ceil(config["frame_height"] / 2)]
+
+    x_values = np.arange(x_range[0], x_range[1] + step, step)
+    y_values = np.arange(y_range[0], y_range[1] + step, step)
+
+    x_grid, y_grid = np.meshgrid(x_values, y_values, indexing="ij")
+    return np.stack([x_grid.ravel(), y_grid.ravel(), np.zeros(x_grid.size)], axis=1)
+
+def get_adaptive_field_points(funcs, num_of_arrows=300, x_range=None, y_range=None, cell_size=1.0, min_cell_size=0.125):
+    # Quadtree over the frame: the cell whose drawn arrows differ most between its
+    # center and corners is split first, until there are num_of_arrows cells.
+    # Arrows are compared as drawn, direction times sigmoid(norm), for every func
+    x_range = x_range or [np.floor(-config["frame_width"] / 2), np.ceil(config["frame_width"] / 2)]
+    y_range = y_range or [np.floor(-config["frame_height"] / 2), np.ceil(config["frame_height"] / 2)]
+    corner_offsets = np.array([[0, 0, 0], [-1, -1, 0], [-1, 1, 0], [1, -1, 0], [1, 1, 0]]) / 2
+
+    def get_variations(centers, size):
+        samples = (centers[:, np.newaxis] + size * corner_offsets).reshape(-1, 3)
+        variations = np.zeros(len(centers))
+        for func in funcs:
+            vectors = evaluate_field(func, samples)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            drawn = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0) * sigmoid(norms)
+            drawn = drawn.reshape(len(centers), len(corner_offsets), 3)
+            variations = np.maximum(variations, np.linalg.norm(drawn[:, 1:] - drawn[:, :1], axis=2).max(axis=1))
+        return variations
+
+    x_values = np.arange(x_range[0] + cell_size / 2, x_range[1], cell_size)
+    y_values = np.arange(y_range[0] + cell_size / 2, y_range[1], cell_size)
+    centers = np.array([[x, y, 0] for x in x_values for y in y_values])
+
+    # Max heap on variation, ties broken by insertion order
+    counter = itertools.count()
+    cells = [(-variation, next(counter), center, cell_size) for center, variation in zip(centers, get_variations(centers, cell_size))]
+    heapq.heapify(cells)
+    leaves = []
+
+    while cells and len(cells) + len(leaves) < num_of_arrows:
+        variation, _, center, size = heapq.heappop(cells)
+        if size / 2 < min_cell_size:
+            leaves.append((center, size))
+            continue
+
+        children = center + (size / 2) * corner_offsets[1:]
+        for child, child_variation in zip(children, get_variations(children, size / 2)):
+            heapq.heappush(cells, (-child_variation, next(counter), child, size / 2))
+
+    leaves += [(center, size) for _, _, center, size in cells]
+    return np.array([center for center, _ in leaves]), np.array([size for _, size in leaves])
+
+def evaluate_field(func, points):
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    if hasattr(func, "batch"):
+        return func.batch(points)
+    return np.array([func(point) for point in points], dtype=float).reshape(-1, 3)
+
+def get_tabulated_field_func(points, values, func):
+    # Serves ArrowVectorField's per point calls from a precomputed table,
+    # falling back to func off the grid
+    table = {
+        tuple(np.round(point, 6)): np.array(value) for point, value in zip(points, values)
+    }
+
+    def tabulated_func(point):
+        key = tuple(np.round(point, 6))
+        if key in table:
+            return table[key].copy()
+        return np.array(func(point), dtype=float)
+
+    table_points = np.array(points, dtype=float)
+    table_values = np.array(values, dtype=float)
+
+    def batch(points):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if points.shape == table_points.shape and np.array_equal(points, table_points):
+            return table_values.copy()
+        return evaluate_field(func, points)
+
+    tabulated_func.batch = batch
+    return tabulated_func
+
+@functools.lru_cache(maxsize=None)
+def get_field_kernel_version():
+    # Cached grids are only valid for the code that produced them, so editing
+    # a kernel or the pole-face model invalidates every entry
+    hasher = hashlib.sha256()
+    for kernel in (get_force_field_func, get_force_field_batch, get_pole_face_batch, BarMagnetSource, BarnesHutTree):
+        hasher.update(inspect.getsource(kernel).encode())
+    return hasher.digest()
+
+class FieldGridCache:
+    def __init__(self, directory=None, max_bytes=512 * 1024**2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get_directory(self):
+        # Resolved lazily so it follows the media dir of the current render
+        return self.directory or os.path.join(config["media_dir"], "field_cache")
+
+    @staticmethod
+    def get_key(point_strength_pairs, radius, points, evaluator=None):
+        hasher = hashlib.sha256(get_field_kernel_version())
+        if evaluator is not None:
+            hasher.update(repr(evaluator).encode())
+        for source in point_strength_pairs:
+            if hasattr(source, "get_key"):
+                hasher.update(source.get_key())
+                continue
+            center, strength = source
+            hasher.update(np.asarray(center, dtype=float).tobytes())
+            hasher.update(np.float64(strength).tobytes())
+        hasher.update(np.float64(radius).tobytes())
+
+        # The grid points pin down both the extents and the step
+        points = np.ascontiguousarray(points, dtype=float)
+        hasher.update(str(points.shape).encode())
+        hasher.update(points.tobytes())
+        return hasher.hexdigest()
+
+    def load(self, key):
+        path = os.path.join(self.get_directory(), key + ".npy")
+
+        # Touching the file on every hit keeps mtime usable as the LRU order. Another
+        # render may evict it at any point, which is just a miss
+        try:
+            os.utime(path)
+            return np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+
+    def save(self, key, values):
+        directory = self.get_directory()
+        os.makedirs(directory, exist_ok=True)
+
+        # Written under a temporary name so concurrent renders never see a partial file
+        temporary_path = os.path.join(directory, f"{key}.{os.getpid()}.tmp.npy")
+        np.save(temporary_path, np.asarray(values, dtype=float))
+        os.replace(temporary_path, os.path.join(directory, key + ".npy"))
+
+        self.evict(keep=key)
+
+    def create(self, key, shape):
+        # For arrays filled in pieces: a memory mapped temporary file, published by commit
+        directory = self.get_directory()
+        os.makedirs(directory, exist_ok=True)
+        return np.lib.format.open_memmap(os.path.join(directory, f"{key}.{os.getpid()}.tmp.npy"), mode="w+", dtype=float, shape=shape)
+
+    def commit(self, key, values):
+        values.flush()
+        os.replace(values.filename, os.path.join(self.get_directory(), key + ".npy"))
+
+        # The mapping outlives the file, so the caller keeps its values even if the
+        # entry is evicted by another render right away
+        self.evict(keep=key)
+        values.flags.writeable = False
+        return values
+
+    def evict(self, keep=None):
+        directory = self.get_directory()
+        entries = []
+        for name in os.listdir(directory):
+            if not name.endswith(".npy") or name.endswith(".tmp.npy") or name == f"{keep}.npy":
+                continue
+            try:
+                status = os.stat(os.path.join(directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime, status.st_size, name))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+field_grid_cache = FieldGridCache()
+
+def sample_field_grid(func, points):
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    if config["disable_caching"] or not hasattr(func, "point_strength_pairs"):
+        return evaluate_field(func, points)
+
+    key = field_grid_cache.get_key(func.point_strength_pairs, func.radius, points, getattr(func, "evaluator", None))
+    values = field_grid_cache.load(key)
+    if values is None:
+        values = evaluate_field(func, points)
+        field_grid_cache.save(key, values)
+    return values
+
+def get_sampled_field_func(func, points=None):
+    points = get_field_grid_points() if points is None else np.asarray(points, dtype=float)
+    return get_tabulated_field_func(points, sample_field_grid(func, points), func)
+
+class SuperposedField:
+    def __init__(self, *sources, points=None, radius=0.5):
+        # Each source is a tuple of point strength pairs, e.g. the two poles of one magnet
+        self.points = get_field_grid_points() if points is None else np.asarray(points, dtype=float).reshape(-1, 3)
+        self.radius = radius
+
+        self.sources = [self.normalize_source(source) for source in sources]
+        self.contributions = np.array([
+            self.get_source_contribution(source) for source in self.sources
+        ]).reshape(len(self.sources), len(self.points), 3)
+        self.values = self.contributions.sum(axis=0)
+
+    @staticmethod
+    def normalize_source(source):
+        return tuple(
+            pair if hasattr(pair, "get_field") else (np.array(pair[0], dtype=float), pair[1])
+            for pair in source
+        )
+
+    def get_source_contribution(self, source):
+        return get_force_field_func(*source, radius=self.radius).batch(self.points)
+
+    def set_source(self, index, *point_strength_pairs):
+        source = self.normalize_source(point_strength_pairs)
+        contribution = self.get_source_contribution(source)
+
+        self.values += contribution - self.contributions[index]
+        self.contributions[index] = contribution
+        self.sources[index] = source
+        return self
+
+    def shift_source(self, index, vector):
+        return self.set_source(index, *[
+            pair.shift(vector) if hasattr(pair, "get_field") else (pair[0] + vector, pair[1])
+            for pair in self.sources[index]
+        ])
+
+    def flip_source(self, index):
+        return self.set_source(index, *[
+            pair.flip() if hasattr(pair, "get_field") else (pair[0], -pair[1])
+            for pair in self.sources[index]
+        ])
+
+    def get_point_strength_pairs(self):
+        return [pair for source in self.sources for pair in source]
+
+    def get_func(self):
+        func = get_force_field_func(*self.get_point_strength_pairs(), radius=self.radius)
+        return get_tabulated_field_func(self.points, self.values, func)
+
+class ArrowBand(VMobject):
+    # The arrows of one magnitude band. Arrows change band as they grow, so a
+    # Transform between fields morphs the field's vectors instead of matching points
+    def __init__(self, vector_field, band_index, **kwargs):
+        super().__init__(**kwargs)
+        self.vector_field = vector_field
+        self.band_index = band_index
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=None):
+        if self.band_index == 0:
+            self.vector_field.set_vectors(interpolate(mobject1.vector_field.vectors, mobject2.vector_field.vectors, alpha))
+        self.interpolate_color(mobject1, mobject2, alpha)
+        return self
+
+class ArrayVectorField(VMobject):
+    def __init__(self, func, points=None, length_func=lambda norm: 0.45 * sigmoid(norm), arrow_scales=None, tip_ratio=0.25, color=None, colors=(BLUE_E, GREEN, YELLOW, RED), min_color_scheme_value=0, max_color_scheme_value=2, num_color_buckets=6, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+
+        # Every arrow is four straight cubic segments: the shaft and a closed
+        # triangular tip, stored as consecutive rows of one points array
+        self.field_points = get_field_grid_points() if points is None else np.asarray(points, dtype=float).reshape(-1, 3)
+        self.length_func = length_func
+        self.arrow_scales = np.ones(len(self.field_points)) if arrow_scales is None else np.asarray(arrow_scales, dtype=float)
+        self.tip_ratio = tip_ratio
+
+        # Colored by magnitude on ArrowVectorField's scheme, one submobject per band,
+        # each holding only the arrows currently in it
+        bucket_colors = [color] if color is not None else color_gradient(colors, num_color_buckets)
+        self.color_scheme_range = (min_color_scheme_value, max_color_scheme_value)
+        self.add(*[
+            ArrowBand(self, index, color=bucket_color, fill_color=bucket_color, fill_opacity=1, stroke_width=stroke_width)
+            for index, bucket_color in enumerate(bucket_colors)
+        ])
+
+        self.set_func(func)
+
+    def get_arrow_points(self, vectors):
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+        norms = np.linalg.norm(vectors, axis=1)
+        lengths = self.length_func(norms) * self.arrow_scales
+
+        directions = np.divide(vectors, norms[:, np.newaxis], out=np.zeros_like(vectors), where=norms[:, np.newaxis] != 0)
+        normals = np.stack([-directions[:, 1], directions[:, 0], np.zeros(len(directions))], axis=1)
+        tip_lengths = (self.tip_ratio * lengths)[:, np.newaxis]
+
+        starts = self.field_points
+        ends = starts + directions * lengths[:, np.newaxis]
+        bases = ends - directions * tip_lengths
+        left_corners = bases + normals * tip_lengths / 2
+        right_corners = bases - normals * tip_lengths / 2
+
+        segment_starts = np.stack([starts, left_corners, ends, right_corners], axis=1)
+        segment_ends = np.stack([bases, ends, right_corners, left_corners], axis=1)
+
+        curves = np.stack([
+            segment_starts,
+            (2 * segment_starts + segment_ends) / 3,
+            (segment_starts + 2 * segment_ends) / 3,
+            segment_ends
+        ], axis=2)
+
+        return curves.reshape(len(starts), -1, 3), norms
+
+    def get_color_buckets(self, norms):
+        low, high = self.color_scheme_range
+        alphas = np.clip((norms - low) / (high - low), 0, 1)
+        return np.minimum((alphas * len(self.submobjects)).astype(int), len(self.submobjects) - 1)
+
+    def set_vectors(self, vectors):
+        self.vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+        arrow_points, norms = self.get_arrow_points(self.vectors)
+        buckets = self.get_color_buckets(norms)
+
+        # An empty band keeps one zero length arrow, so the family a Transform walks
+        # never changes length halfway through
+        empty_band = np.repeat(self.field_points[:1], arrow_points.shape[1], axis=0)
+        for index, bucket in enumerate(self.submobjects):
+            band_points = arrow_points[buckets == index].reshape(-1, 3)
+            bucket.set_points(band_points if len(band_points) else empty_band)
+        return self
+
+    def set_func(self, func):
+        self.func = func
+        return self.set_vectors(sample_field_grid(func, self.field_points))
+
+glyph_cache = {}
+
+def get_glyph_key(mobject_class, args, kwargs):
+    return (mobject_class.__name__, args, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+
+def get_glyph(mobject_class, *args, **kwargs):
+    # Parsed once per string, template and style; callers get their own copy
+    key = get_glyph_key(mobject_class, args, kwargs)
+    if key not in glyph_cache:
+        glyph_cache[key] = mobject_class(*args, **kwargs)
+    return glyph_cache[key].copy()
+
+def cached_text(text, **kwargs):
+    return get_glyph(Text, text, **kwargs)
+
+def cached_tex(*tex_strings, **kwargs):
+    return get_glyph(Tex, *tex_strings, **kwargs)
+
+def cached_math_tex(*tex_strings, **kwargs):
+    return get_glyph(MathTex, *tex_strings, **kwargs)
+
+GLYPH_CONSTRUCTORS = {
+    "Text": Text, "cached_text": Text,
+    "Tex": Tex, "cached_tex": Tex,
+    "MathTex": MathTex, "cached_math_tex": MathTex,
+}
+
+def find_glyph_literals(scene_class):
+    # Every glyph call in the scene's own classes whose arguments are literals or module constants
+    module_globals = vars(inspect.getmodule(scene_class))
+
+    def resolve(node):
+        if isinstance(node, ast.Name) and node.id in module_globals:
+            return module_globals[node.id]
+        return ast.literal_eval(node)
+
+    # The scene's own classes, then any helper functions of this module they call
+    sources = [cls for cls in scene_class.__mro__ if cls.__module__ == scene_class.__module__]
+    scanned = set()
+
+    glyph_literals = []
+    while sources:
+        source = sources.pop()
+        if source in scanned:
+            continue
+        scanned.add(source)
+
+        for node in ast.walk(ast.parse(textwrap.dedent(inspect.getsource(source)))):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+                continue
+            if node.func.id not in GLYPH_CONSTRUCTORS:
+                helper = inspect.unwrap(module_globals.get(node.func.id))
+                if inspect.isfunction(helper) and helper.__module__ == scene_class.__module__:
+                    sources.append(helper)
+                continue
+            try:
+                args = tuple(resolve(arg) for arg in node.args)
+                kwargs = {keyword.arg: resolve(keyword.value) for keyword in node.keywords if keyword.arg is not None}
+            except ValueError:
+                continue
+            glyph_literals.append((GLYPH_CONSTRUCTORS[node.func.id], args, kwargs))
+
+    return glyph_literals
+
+def prewarm_glyph_cache(scene_class, max_workers=None):
+    pending = {}
+    for mobject_class, args, kwargs in find_glyph_literals(scene_class):
+        key = get_glyph_key(mobject_class, args, kwargs)
+        if key not in glyph_cache:
+            pending[key] = (mobject_class, args, kwargs)
+
+    # LaTeX runs as a subprocess, so compiles overlap across threads; text shaping
+    # goes through pango and stays on this thread
+    tex_glyphs = {key: glyph for key, glyph in pending.items() if glyph[0] is not Text}
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        compiled = executor.map(lambda glyph: glyph[0](*glyph[1], **glyph[2]), tex_glyphs.values())
+        glyph_cache.update(zip(tex_glyphs, compiled))
+
+    for key, (mobject_class, args, kwargs) in pending.items():
+        if key not in glyph_cache:
+            glyph_cache[key] = mobject_class(*args, **kwargs)
+
+class GlyphCacheScene(Scene):
+    def setup(self):
+        prewarm_glyph_cache(type(self))
+
+class MakeBarMagnet(GlyphCacheScene):
     def construct(self):
         north_monopole = Circle()
         north_monopole.set_fill(opacity=0.5)
         self.play(Create(north_monopole))
 
-        north_circle_label = Text("N")
+        north_circle_label = cached_text("N")
         self.play(Write(north_circle_label))
 
         north_monopole_group = Group(north_monopole, north_circle_label)
@@ -37,27 +646,32 @@ class MakeBarMagnet(Scene):
             (ORIGIN, +1)
         )
 
-        vector_field = ArrowVectorField(func)
+        bar_magnet_func = get_force_field_func(
+            (3 * LEFT, +1), (3 * RIGHT, -1)
+        )
+
+        # Both fields share one set of arrows, packed in wherever either of them turns
+        # or changes strength quickly; arrows shrink with their cell past the 0.5 grid
+        field_points, cell_sizes = get_adaptive_field_points([func, bar_magnet_func], num_of_arrows=300)
+        vector_field = ArrayVectorField(func, points=field_points, arrow_scales=np.minimum(1, cell_sizes / 0.5))
 
         self.play(FadeIn(vector_field))
 
         self.wait()
 
         # Bar Magnet Field
-        func = get_force_field_func(
-            (3 * LEFT, +1), (3 * RIGHT, -1)
-        )
+        func = bar_magnet_func
 
         south_monopole = Circle(color=BLUE)
         south_monopole.set_fill(opacity=0.5)
 
-        south_circle_label = Text("S")
+        south_circle_label = cached_text("S")
 
         south_monopole_group = Group(south_monopole, south_circle_label)
         south_monopole_group.move_to(3 * RIGHT)
 
         monopole_to_bar_magnet_field = AnimationGroup(
-            vector_field.animate.become(ArrowVectorField(func)),
+            vector_field.animate.set_func(func),
             north_monopole_group.animate.shift(3 * LEFT),
             FadeIn(south_monopole_group)
         )
@@ -90,7 +704,7 @@ def draw_bar_magnet(width=4, height=1, south_left=False):
     north_monopole_bar_magnet.move_to(width/4 * RIGHT if south_left else LEFT)
     north_monopole_bar_magnet.set_fill(color=RED, opacity=0.5)
 
-    north_label = Text("N")
+    north_label = cached_text("N")
     north_label.move_to((width/2-1) * RIGHT if south_left else LEFT)
 
 
@@ -98,12 +712,95 @@ def draw_bar_magnet(width=4, height=1, south_left=False):
     south_monopole_bar_magnet.move_to(width/4 * LEFT if south_left else RIGHT)
     south_monopole_bar_magnet.set_fill(color=BLUE, opacity=0.5)
 
-    south_label = Text("S")
+    south_label = cached_text("S")
     south_label.move_to((width/2-1) * LEFT if south_left else RIGHT)
 
     return Group(north_monopole_bar_magnet, north_label, south_monopole_bar_magnet, south_label)
 
-class Repulsion(Scene):
+class BarMagnetSource:
+    # Uniformly magnetized rectangle: its field is that of the surface charge on the
+    # two pole faces, +strength on the north end face and -strength on the south one.
+    # The faces are softened by their own Plummer length, 0.05 by default, and ignore
+    # the radius get_force_field_func passes point sources: a line charge is already
+    # spread out, so the wide 0.5 core would only blur the field at the magnet's ends
+    field_memo = {}
+    max_memo_size = 64
+
+    def __init__(self, north_face, south_face, strength=1, softening=0.05):
+        self.starts = np.array([north_face[0], south_face[0]], dtype=float)
+        self.ends = np.array([north_face[1], south_face[1]], dtype=float)
+        self.strength = strength
+        self.softening = softening
+
+    @classmethod
+    def from_bar_magnet(cls, bar_magnet, strength=1, softening=0.05):
+        north_monopole_bar_magnet, north_label, south_monopole_bar_magnet, south_label = bar_magnet
+        axis = normalize(north_monopole_bar_magnet.get_center() - south_monopole_bar_magnet.get_center())
+
+        # The outer edges of each half, whichever way the magnet has been turned
+        north_vertices = sorted(north_monopole_bar_magnet.get_vertices(), key=lambda vertex: -np.dot(vertex, axis))
+        south_vertices = sorted(south_monopole_bar_magnet.get_vertices(), key=lambda vertex: np.dot(vertex, axis))
+        return cls(north_vertices[:2], south_vertices[:2], strength, softening)
+
+    def get_field(self, points):
+        # Memoized per geometry and sample points, so a magnet that comes back to an
+        # earlier pose, like one flipped twice, reuses that evaluation
+        points = np.ascontiguousarray(points, dtype=float)
+        memo_key = (self.get_key(), points.shape, hashlib.blake2b(points.data, digest_size=16).digest())
+        if memo_key not in BarMagnetSource.field_memo:
+            if len(BarMagnetSource.field_memo) >= BarMagnetSource.max_memo_size:
+                del BarMagnetSource.field_memo[next(iter(BarMagnetSource.field_memo))]
+
+            values = get_pole_face_batch(points, self.starts, self.ends, [+self.strength, -self.strength], self.softening)
+            values.flags.writeable = False
+            BarMagnetSource.field_memo[memo_key] = values
+        return BarMagnetSource.field_memo[memo_key]
+
+    def get_key(self):
+        return np.concatenate([self.starts.ravel(), self.ends.ravel(), [self.strength, self.softening]]).tobytes()
+
+    def shift(self, vector):
+        return BarMagnetSource(
+            (self.starts[0] + vector, self.ends[0] + vector), (self.starts[1] + vector, self.ends[1] + vector), self.strength, self.softening
+        )
+
+    def flip(self):
+        return BarMagnetSource((self.starts[0], self.ends[0]), (self.starts[1], self.ends[1]), -self.strength, self.softening)
+
+class LiveMagnetField(ArrayVectorField):
+    def __init__(self, *bar_magnets, step=0.25, radius=0.5, length_func=None, **kwargs):
+        self.bar_magnets = bar_magnets
+        self.field = SuperposedField(
+            *[(BarMagnetSource.from_bar_magnet(bar_magnet),) for bar_magnet in bar_magnets],
+            points=get_field_grid_points(step=step),
+            radius=radius
+        )
+
+        if length_func is None:
+            length_func = lambda norm: 0.9 * step * sigmoid(norm)
+
+        super().__init__(self.field.get_func(), points=self.field.points, length_func=length_func, **kwargs)
+
+        self.add_updater(lambda vector_field: vector_field.update_sources())
+
+    def update_sources(self):
+        # Every frame, so what is drawn depends only on where the magnets are
+        changed = False
+        for index, bar_magnet in enumerate(self.bar_magnets):
+            source = BarMagnetSource.from_bar_magnet(bar_magnet)
+            current_source, = self.field.sources[index]
+
+            if np.allclose(source.starts, current_source.starts) and np.allclose(source.ends, current_source.ends):
+                continue
+
+            self.field.set_source(index, source)
+            changed = True
+
+        if changed:
+            self.set_vectors(self.field.values)
+        return self
+
+class Repulsion(GlyphCacheScene):
     def construct(self):
         bar_magnet_one = draw_bar_magnet().move_to(4 * LEFT)
         bar_magnet_two = draw_bar_magnet(south_left=True).move_to(4 * RIGHT)
@@ -117,39 +814,23 @@ class Repulsion(Scene):
 
         self.wait()
 
-        func = get_force_field_func(
-            (3 * LEFT, -1), (5 * LEFT, +1),
-            (3 * RIGHT, -1), (5 * RIGHT, +1)
-        )
-
-        vector_field = ArrowVectorField(func)
+        # Re-evaluated every frame from wherever the magnets currently are
+        vector_field = LiveMagnetField(bar_magnet_one, bar_magnet_two)
 
         self.play(FadeIn(vector_field))
 
         self.wait(duration=10)
 
-        func = get_force_field_func(
-            (3 * LEFT, -1), (5 * LEFT, +1),
-            (3 * RIGHT, +1), (5 * RIGHT, -1)
-        )
-
         flip_bar_magnet = AnimationGroup(
-            Rotate(bar_magnet_two, PI),
-            vector_field.animate.become(ArrowVectorField(func))
+            Rotate(bar_magnet_two, PI)
         )
 
         self.play(flip_bar_magnet)
 
 
-        func = get_force_field_func(
-            (1 * LEFT, -1), (3 * LEFT, +1),
-            (1 * RIGHT, +1), (3 * RIGHT, -1)
-        )
-
         stick_bar_magnet = AnimationGroup(
             bar_magnet_one.animate.shift(2 * RIGHT),
-            bar_magnet_two.animate.shift(2 * LEFT),
-            vector_field.animate.become(ArrowVectorField(func))
+            bar_magnet_two.animate.shift(2 * LEFT)
         )
 
         self.play(stick_bar_magnet)
@@ -157,29 +838,17 @@ class Repulsion(Scene):
         self.wait(duration=2)
 
 
-        func = get_force_field_func(
-            (1 * LEFT, -1), (3 * LEFT, +1),
-            (1 * RIGHT, -1), (3 * RIGHT, +1)
-        )
-
         flip_bar_magnet = AnimationGroup(
-            Rotate(bar_magnet_two, PI),
-            vector_field.animate.become(ArrowVectorField(func))
+            Rotate(bar_magnet_two, PI)
         )
 
         self.play(flip_bar_magnet)
 
         self.wait()
 
-        func = get_force_field_func(
-            (3 * LEFT, -1), (5 * LEFT, +1),
-            (3 * RIGHT, -1), (5 * RIGHT, +1)
-        )
-
         unstick_bar_magnet = AnimationGroup(
             bar_magnet_one.animate.shift(2 * LEFT),
-            bar_magnet_two.animate.shift(2 * RIGHT),
-            vector_field.animate.become(ArrowVectorField(func))
+            bar_magnet_two.animate.shift(2 * RIGHT)
         )
 
         self.play(unstick_bar_magnet)
@@ -187,39 +856,139 @@ class Repulsion(Scene):
         self.wait()
 
 
-def represent_current(current_value, scene, wire: Line, left_end: Dot, right_end: Dot):
-    number_of_current_dots = 10
+# Carrier speeds were tuned as distances per frame at 60 fps; updaters scale them by dt,
+# so the motion is the same at any frame rate and when a skipped play hands over its
+# whole run time as one step
+CARRIER_FRAME_RATE = 60
+
+class CarrierStream(VMobject):
+    def __init__(self, wire: Line, number_of_carriers=10, carrier_radius=DEFAULT_DOT_RADIUS, spread=0.0, color=BLUE, seed=0, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+
+        self.start = wire.get_start()
+        self.length = wire.get_length()
+        self.direction = wire.get_unit_vector()
+        normal = np.array([-self.direction[1], self.direction[0], 0.0])
+
+        # Every carrier is one circular subpath of a single VMobject, so a frame
+        # only touches one offset array and one points array
+        self.offsets = (np.arange(number_of_carriers) + 1) * self.length / number_of_carriers
+        lateral_offsets = np.random.default_rng(seed).uniform(-spread / 2, spread / 2, number_of_carriers)
+        self.lateral_shifts = lateral_offsets[:, np.newaxis] * normal
+
+        carrier_outline = Circle(radius=carrier_radius)
+        self.carrier_points = carrier_outline.get_points() - carrier_outline.get_center()
 
-    current_spacing = wire.get_length() / number_of_current_dots
+        self.update_carrier_points()
 
-    def move_current(dot: Dot):
-        dot.shift(current_value() * RIGHT)
+    def update_carrier_points(self):
+        centers = self.start + self.offsets[:, np.newaxis] * self.direction + self.lateral_shifts
+        self.set_points((centers[:, np.newaxis, :] + self.carrier_points[np.newaxis, :, :]).reshape(-1, 3))
+        return self
 
-        if dot.get_center()[0] >= wire.get_end()[0]:
-            dot.move_to(wire.get_start())
+    def advance(self, distance):
+        # Carriers leaving the end of the wire wrap back around to its start
+        np.mod(self.offsets + distance, self.length, out=self.offsets)
+        return self.update_carrier_points()
 
+def represent_current(current_value, scene, wire: Line, left_end: Dot, right_end: Dot, number_of_current_dots=10, **kwargs):
     z_index = left_end.z_index
     left_end.set_z_index(z_index + 1)
     right_end.set_z_index(z_index + 1)
 
-    dot_group = VGroup()
-    for i in range(number_of_current_dots):
-        dot = Dot(
-                color=BLUE
-            ).move_to(
-                wire.get_start() + (i+1) * current_spacing * RIGHT
-            ).set_z_index(
-                z_index
-            ).add_updater(move_current)
+    current_stream = CarrierStream(wire, number_of_current_dots, **kwargs).set_z_index(z_index)
+    current_stream.add_updater(lambda stream, dt: stream.advance(current_value() * CARRIER_FRAME_RATE * dt))
 
-        dot_group.add(dot)
-
-    scene.play(FadeIn(dot_group))
+    scene.play(FadeIn(current_stream))
     
 
-class CurrentInWire(Scene):
+@functools.lru_cache(maxsize=None)
+def get_bloch_gruneisen_table(debye_temperature, exponent=5, max_temperature=3, num_of_samples=1024, num_of_nodes=128):
+    # (T / θ)^n * ∫ x^n / ((e^x - 1)(1 - e^-x)) dx from 0 to θ / T, evaluated for
+    # every temperature at once with Gauss-Legendre nodes scaled to each upper limit.
+    # The integrand has died off long before x = 60, so larger limits are clamped
+    temperatures = np.linspace(0, max_temperature, num_of_samples)
+    nodes, weights = np.polynomial.legendre.leggauss(num_of_nodes)
+    nodes, weights = 0.5 * (nodes + 1), 0.5 * weights
+
+    values = np.zeros(num_of_samples)
+    reduced_temperatures = temperatures[1:] / debye_temperature
+    upper_limits = np.minimum(1 / reduced_temperatures, 60)
+
+    x = upper_limits[:, None] * nodes[None, :]
+    integrand = x**exponent / (np.expm1(x) * -np.expm1(-x))
+    values[1:] = reduced_temperatures**exponent * upper_limits * (integrand @ weights)
+
+    return temperatures, values
+
+class NormalMetalResistivity:
+    def __init__(self, residual_resistivity=1, coupling=1, debye_temperature=1.5, exponent=5, max_temperature=3):
+        self.residual_resistivity = residual_resistivity
+        self.coupling = coupling
+        self.temperatures, self.phonon_resistivity = get_bloch_gruneisen_table(debye_temperature, exponent, max_temperature)
+
+    def __call__(self, temperature):
+        return self.residual_resistivity + self.coupling * np.interp(temperature, self.temperatures, self.phonon_resistivity)
+
+class SuperconductorResistivity:
+    def __init__(self, normal_resistivity, critical_temperature=0.5, superconducting_value=0.001):
+        self.normal_resistivity = normal_resistivity
+        self.critical_temperature = critical_temperature
+        self.superconducting_value = superconducting_value
+
+    def __call__(self, temperature):
+        # Normal state at and above Tc, flat below it
+        return np.where(
+            np.asarray(temperature) >= self.critical_temperature,
+            self.normal_resistivity(temperature),
+            self.superconducting_value
+        )[()]
+
+class GraphTrackerDot(Dot):
+    def __init__(self, ax, tracker, func, critical_temperature=None, superconducting_value=0.001, num_of_samples=2048, **kwargs):
+        super().__init__(**kwargs)
+
+        # Resistivity models with a transition carry their own Tc
+        critical_temperature = getattr(func, "critical_temperature", critical_temperature)
+        superconducting_value = getattr(func, "superconducting_value", superconducting_value)
+
+        self.tracker = tracker
+        self.critical_temperature = critical_temperature
+
+        # The curve is sampled into scene coordinates once, then each frame is a
+        # table lookup. At and above the critical temperature the normal curve
+        # applies, below it the flat superconducting section
+        x_min, x_max = ax.x_range[:2]
+        if critical_temperature is None:
+            self.sections = [self.get_section(ax, func, x_min, x_max, num_of_samples)]
+        else:
+            self.sections = [
+                self.get_section(ax, lambda x: superconducting_value, x_min, critical_temperature, num_of_samples),
+                self.get_section(ax, func, critical_temperature, x_max, num_of_samples)
+            ]
+
+        self.follow_tracker()
+        self.add_updater(lambda dot: dot.follow_tracker())
+
+    @staticmethod
+    def get_section(ax, func, x_min, x_max, num_of_samples):
+        x_values = np.linspace(x_min, x_max, num_of_samples)
+        points = np.array([ax.c2p(x, func(x)) for x in x_values])
+        return x_values, points
+
+    def follow_tracker(self):
+        x = self.tracker.get_value()
+        if self.critical_temperature is not None and x >= self.critical_temperature:
+            x_values, points = self.sections[1]
+        else:
+            x_values, points = self.sections[0]
+
+        self.move_to([np.interp(x, x_values, points[:, axis]) for axis in range(3)])
+        return self
+
+class CurrentInWire(GlyphCacheScene):
     def construct(self):
-        scene_label = Text("Normal Metal").shift(3 * DOWN)
+        scene_label = cached_text("Normal Metal").shift(3 * DOWN)
         self.play(Write(scene_label))
 
         length = 8
@@ -243,8 +1012,7 @@ class CurrentInWire(Scene):
 
         self.wait()
 
-        def func(x):
-            return 1 + (0.4 * x)**2 # Sketchy Plot
+        func = NormalMetalResistivity(residual_resistivity=1, coupling=2.9, debye_temperature=1.5)
 
         temprature_value = ValueTracker(3)
         temprature_value.set_value(3)
@@ -256,9 +1024,9 @@ class CurrentInWire(Scene):
             else:
                 return (0.2 * func(0.1)) / func(temprature_value.get_value()) # I = V / R
 
-        represent_current(get_current, self, wire, left_end, right_end)
+        represent_current(get_current, self, wire, left_end, right_end, number_of_current_dots=2000, carrier_radius=0.015, spread=0.12)
 
-        wire_label = MathTex("I = \\frac{V}{R}").next_to(wire, LEFT)
+        wire_label = cached_math_tex("I = \\frac{V}{R}").next_to(wire, LEFT)
 
         self.play(Write(wire_label))
 
@@ -268,13 +1036,11 @@ class CurrentInWire(Scene):
             x_range=[0, 3, 0.5], y_range=[0, 3, 0.5], x_length=5, y_length=3, axis_config={"include_tip": False}
         )        
         ax.shift(1.5 * UP)
-        labels = ax.get_axis_labels(Text("Temperature").scale(0.4), Text("Resistivity").scale(0.4))
+        labels = ax.get_axis_labels(cached_text("Temperature").scale(0.4), cached_text("Resistivity").scale(0.4))
 
         graph = ax.plot(func, color=MAROON)
 
-        initial_point = [ax.coords_to_point(temprature_value.get_value(), func(temprature_value.get_value()))]
-        dot = Dot(point=initial_point)
-        dot.add_updater(lambda x: x.move_to(ax.c2p(temprature_value.get_value(), func(temprature_value.get_value()))))
+        dot = GraphTrackerDot(ax, temprature_value, func)
 
         self.play(Create(ax))
         self.play(Write(labels))
@@ -288,9 +1054,51 @@ class CurrentInWire(Scene):
         self.wait()
 
 
-class CurrentInSuperconductor(Scene):
+class CurrentCarrier(VMobject):
+    def __init__(self, loop_center, loop_radius, particle_radius=0.08, color=BLUE, **kwargs):
+        super().__init__(color=color, fill_color=color, fill_opacity=1, **kwargs)
+
+        # Both forms are prebuilt Circles with matching point counts, so switching
+        # or blending between them only writes into the existing points array
+        self.loop_center = np.array(loop_center, dtype=float)
+        self.particle_offsets = Circle(radius=particle_radius).move_to(loop_radius * UP).get_points().copy()
+        self.ring_points = Circle(radius=loop_radius).move_to(self.loop_center).get_points().copy()
+
+        self.angle = 0.0
+        self.rotation_matrix = np.identity(3)
+        self.ring_buffer = np.empty_like(self.ring_points)
+
+        self.set_points(self.particle_offsets + self.loop_center)
+        self.set_state(0)
+
+    def set_state(self, ring_blend):
+        cos_angle, sin_angle = np.cos(self.angle), np.sin(self.angle)
+        self.rotation_matrix[0, 0], self.rotation_matrix[0, 1] = cos_angle, sin_angle
+        self.rotation_matrix[1, 0], self.rotation_matrix[1, 1] = -sin_angle, cos_angle
+
+        np.dot(self.particle_offsets, self.rotation_matrix, out=self.points)
+        self.points += self.loop_center
+        self.points *= 1 - ring_blend
+        np.multiply(self.ring_points, ring_blend, out=self.ring_buffer)
+        self.points += self.ring_buffer
+
+        self.fill_rgbas[:, 3] = 1 - ring_blend
+        return self
+
+    def follow_temperature(self, temperature, resistivity, critical_temperature=0.5, tracking_current=True, dt=1 / CARRIER_FRAME_RATE):
+        # Normal at and above Tc, like SuperconductorResistivity and GraphTrackerDot
+        if temperature < critical_temperature:
+            # Persistent current around the whole loop, the particle restarts from the top
+            self.angle = 0.0
+            return self.set_state(1)
+
+        if tracking_current:
+            self.angle += CARRIER_FRAME_RATE * dt / resistivity
+        return self.set_state(0)
+
+class CurrentInSuperconductor(GlyphCacheScene):
     def construct(self):
-        scene_label = Text("Super Conductor").shift(3.5 * DOWN)
+        scene_label = cached_text("Super Conductor").shift(3.5 * DOWN)
 
         self.play(Write(scene_label))
 
@@ -316,51 +1124,38 @@ class CurrentInSuperconductor(Scene):
         ) 
 
         ax.shift(1.5 * UP)
-        labels = ax.get_axis_labels(Text("Temprature").scale(0.4), Text("Resistivity").scale(0.4))
+        labels = ax.get_axis_labels(cached_text("Temprature").scale(0.4), cached_text("Resistivity").scale(0.4))
 
-        def func(x):
-            return 1.5 + (0.4 * x)**3 # Sketchy Plot
+        func = SuperconductorResistivity(
+            NormalMetalResistivity(residual_resistivity=1.5, coupling=2.8, debye_temperature=1.5), critical_temperature=0.5
+        )
 
-        nonlinear_graph_section = ax.plot(func, color=GOLD, x_range=[0.5, 3])
-        t_label = ax.get_T_label(x_val=0.5, graph=nonlinear_graph_section, line_color=GOLD, label=Tex("$T_{C}$"))
-        linear_graph_section = ax.plot(lambda x: 0.001, color=GOLD, x_range=[0, 0.5])
+        nonlinear_graph_section = ax.plot(func.normal_resistivity, color=GOLD, x_range=[0.5, 3])
+        t_label = ax.get_T_label(x_val=0.5, graph=nonlinear_graph_section, line_color=GOLD, label=cached_tex("$T_{C}$"))
+        linear_graph_section = ax.plot(lambda x: func.superconducting_value, color=GOLD, x_range=[0, 0.5])
         
-        current_dot = Circle(color=BLUE, radius=0.08, fill_opacity=1).move_to(wire_loop.get_center() + wire_loop.radius * UP)
+        current_dot = CurrentCarrier(wire_loop.get_center(), wire_loop.radius)
         current_dot.save_state()
 
         self.play(Create(current_dot))
 
         self.wait()
 
-        wire_label = MathTex("I = \\frac{V}{R}").next_to(wire, 1.5 * LEFT)
+        wire_label = cached_math_tex("I = \\frac{V}{R}").next_to(wire, 1.5 * LEFT)
 
         self.play(Write(wire_label))
 
         self.wait()
 
-        def current_dot_position(dot: Dot):
-            if temprature_value.get_value() <= 0.5:
-                    dot.become(Circle(radius=0.7, color=BLUE, fill_opacity=0).move_to(wire_loop.get_center()))
-            else:
-                if dot.get_center()[0] == wire_loop.get_center()[0]:
-                    dot.become(Circle(color=BLUE, radius=0.08, fill_opacity=1)).move_to(wire_loop.get_center() + wire_loop.radius * UP)
-
-                if tracking_current:
-                    dot.rotate(1.0 / func(temprature_value.get_value()), about_point=wire_loop.get_center())
+        def current_dot_position(dot: CurrentCarrier, dt):
+            temperature = temprature_value.get_value()
+            dot.follow_temperature(temperature, func(temperature), critical_temperature=func.critical_temperature, tracking_current=tracking_current, dt=dt)
 
         current_dot.add_updater(current_dot_position)
 
         self.wait()
 
-        initial_point = [ax.coords_to_point(temprature_value.get_value(), func(temprature_value.get_value()))]
-        dot = Dot(point=initial_point)
-        def tracker_dot_position(x: Dot):
-            if ax.p2c(x.get_center())[0] >= 0.5:
-                x.move_to(ax.c2p(temprature_value.get_value(), func(temprature_value.get_value())))
-            else:
-                x.move_to(ax.c2p(temprature_value.get_value(), 0.001))
-
-        dot.add_updater(tracker_dot_position)
+        dot = GraphTrackerDot(ax, temprature_value, func)
 
         self.play(Create(ax))
         self.play(Write(labels))
@@ -377,31 +1172,184 @@ class CurrentInSuperconductor(Scene):
 
         self.wait()
 
-def make_proton():
+@functools.lru_cache(maxsize=None)
+def get_proton_template():
     proton = Circle(radius=0.3, color=RED, fill_opacity=0.5)
-    proton_label = Text("+")
+    proton_label = cached_text("+")
+
+    return VGroup(proton, proton_label)
+
+@functools.lru_cache(maxsize=None)
+def get_electron_template():
+    electron = Circle(radius=0.2, color=GOLD, fill_opacity=0.5)
+    electron_label = cached_text("-")
+
+    return VGroup(electron, electron_label)
+
+def make_proton():
+    proton, proton_label = particle = get_proton_template().copy()
 
     proton_animation_group = AnimationGroup(
         Create(proton),
         Write(proton_label)
     )
 
-    return VGroup(proton, proton_label), proton_animation_group
+    return particle, proton_animation_group
 
 def make_electron():
-    electron = Circle(radius=0.2, color=GOLD, fill_opacity=0.5)
-    electron_label = Text("-")
+    electron, electron_label = particle = get_electron_template().copy()
 
     electron_animation_group = AnimationGroup(
         Create(electron),
         Write(electron_label)
     )
     
-    return VGroup(electron, electron_label), electron_animation_group
+    return particle, electron_animation_group
+
+def get_lattice_sites(columns, rows, spacing):
+    column_offsets = (np.arange(columns) - (columns - 1) / 2.0) * spacing
+    row_offsets = (np.arange(rows) - (rows - 1) / 2.0) * spacing
+
+    row_grid, column_grid = np.meshgrid(row_offsets, column_offsets, indexing="ij")
+    return np.stack([column_grid.ravel(), row_grid.ravel(), np.zeros(row_grid.size)], axis=1)
+
+class ParticleLattice(VGroup):
+    def __init__(self, template, columns, rows, spacing, **kwargs):
+        super().__init__(**kwargs)
+
+        self.columns = columns
+        self.rows = rows
+        self.spacing = spacing
+
+        # Glyphs are built once in the template, every site is a plain copy
+        template = template.copy().move_to(ORIGIN)
+        self.add(*[template.copy().shift(site) for site in get_lattice_sites(columns, rows, spacing)])
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            column, row = index
+            return self.submobjects[row * self.columns + column]
+        return super().__getitem__(index)
+
+    def add(self, *mobjects):
+        self.point_buffer = None
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects):
+        self.point_buffer = None
+        return super().remove(*mobjects)
+
+    def is_point_buffer_attached(self):
+        # Animations on the lattice, like FadeIn, replace every points array, so the
+        # first and last views stand in for all of them instead of a walk per frame
+        return self.point_buffer is not None and all(
+            member.points.base is self.point_buffer for member in (self.point_members[0], self.point_members[-1])
+        )
+
+    def get_point_buffer(self):
+        # Every particle's points are views into one array, so moving the whole lattice
+        # is a single add. Anything that replaces the points arrays detaches them, and
+        # the buffer is rebuilt on the next call
+        if self.is_point_buffer_attached():
+            return self.point_buffer
+
+        members = [
+            [member for member in particle.get_family() if len(member.points)]
+            for particle in self.submobjects
+        ]
+        self.point_members = list(itertools.chain.from_iterable(members))
+        self.point_buffer = np.concatenate([member.points for member in self.point_members])
+        self.point_counts = np.array([sum(len(member.points) for member in particle_members) for particle_members in members])
+        self.first_point_indices = np.concatenate([[0], np.cumsum(self.point_counts)[:-1]])
+
+        offset = 0
+        for member in self.point_members:
+            member.points = self.point_buffer[offset:offset + len(member.points)]
+            offset += len(member.points)
+
+        # Centers ride along with each particle's first point under translation
+        self.center_offsets = np.array([particle.get_center() for particle in self.submobjects]) - self.point_buffer[self.first_point_indices]
+        return self.point_buffer
+
+    def get_positions(self):
+        return self.get_point_buffer()[self.first_point_indices] + self.center_offsets
+
+    def set_positions(self, positions):
+        point_buffer = self.get_point_buffer()
+        current_positions = point_buffer[self.first_point_indices] + self.center_offsets
+        point_buffer += np.repeat(np.asarray(positions, dtype=float) - current_positions, self.point_counts, axis=0)
+        return self
+
+class LatticeDynamics:
+    def __init__(self, rest_positions, columns, rows, mass=1.0, tether_constant=1.0, spring_constant=1.0, coulomb_strength=0.5, softening=0.3, damping=2.0, max_dt=1 / 60):
+        self.rest_positions = np.array(rest_positions, dtype=float)[:, :2]
+        self.positions = self.rest_positions.copy()
+        self.velocities = np.zeros_like(self.positions)
+        self.z_values = np.array(rest_positions, dtype=float)[:, 2]
+
+        self.mass = mass
+        self.tether_constant = tether_constant
+        self.spring_constant = spring_constant
+        self.coulomb_strength = coulomb_strength
+        self.softening = softening
+        self.damping = damping
+        self.max_dt = max_dt
+
+        # Nearest neighbour springs on the row major grid ParticleLattice builds
+        indices = np.arange(columns * rows).reshape(rows, columns)
+        self.springs = np.concatenate([
+            np.stack([indices[:, :-1].ravel(), indices[:, 1:].ravel()], axis=1),
+            np.stack([indices[:-1, :].ravel(), indices[1:, :].ravel()], axis=1)
+        ])
+        self.rest_lengths = np.linalg.norm(
+            self.rest_positions[self.springs[:, 1]] - self.rest_positions[self.springs[:, 0]], axis=1
+        )
+
+        self.electron_positions = np.zeros((0, 2))
+        self.accelerations = self.get_forces() / self.mass
+
+    def get_forces(self):
+        forces = -self.tether_constant * (self.positions - self.rest_positions)
+
+        first, second = self.springs[:, 0], self.springs[:, 1]
+        offsets = self.positions[second] - self.positions[first]
+        lengths = np.linalg.norm(offsets, axis=1)
+        spring_forces = (self.spring_constant * (lengths - self.rest_lengths) / lengths)[:, np.newaxis] * offsets
+
+        for axis in range(2):
+            forces[:, axis] += np.bincount(first, spring_forces[:, axis], len(self.positions))
+            forces[:, axis] -= np.bincount(second, spring_forces[:, axis], len(self.positions))
+
+        # Softened Coulomb pull of every ion toward every electron
+        to_electrons = self.electron_positions[np.newaxis, :, :] - self.positions[:, np.newaxis, :]
+        distances_squared = np.sum(to_electrons**2, axis=2, keepdims=True) + self.softening**2
+        forces += self.coulomb_strength * np.sum(to_electrons / distances_squared**1.5, axis=1)
+
+        return forces
+
+    def step(self, dt):
+        # Velocity Verlet, with damping applied as an exact decay afterwards
+        self.positions += self.velocities * dt + 0.5 * self.accelerations * dt**2
+        new_accelerations = self.get_forces() / self.mass
+        self.velocities += 0.5 * (self.accelerations + new_accelerations) * dt
+        self.velocities *= np.exp(-self.damping * dt)
+        self.accelerations = new_accelerations
+        return self
+
+    def advance(self, duration, electron_positions):
+        self.electron_positions = np.array(electron_positions, dtype=float).reshape(-1, 3)[:, :2]
 
-class ProtonLattice(Scene):
+        num_of_steps = int(np.ceil(duration / self.max_dt))
+        for _ in range(num_of_steps):
+            self.step(duration / num_of_steps)
+        return self
+
+    def get_positions(self):
+        return np.column_stack([self.positions, self.z_values])
+
+class ProtonLattice(GlyphCacheScene):
     def construct(self):
-        scene_label = Text("Super Conductor Proton Lattice").shift(3.25 * UP)
+        scene_label = cached_text("Super Conductor Proton Lattice").shift(3.25 * UP)
 
         self.play(Write(scene_label))
 
@@ -412,17 +1360,8 @@ class ProtonLattice(Scene):
 
         proton_lattice_spacing = 1.5
 
-        protons = np.empty((proton_lattice_width, proton_lattice_height), dtype=VGroup)
-        proton_group = VGroup()
-        for i in range(proton_lattice_height):
-            for j in range(proton_lattice_width):
-                proton, proton_animation_group = make_proton()
-                proton.move_to(    
-                    ((-(proton_lattice_width-1) * proton_lattice_spacing/2.0) + proton_lattice_spacing * j) * RIGHT + 
-                    ((-(proton_lattice_height-1) * proton_lattice_spacing/2.0) + proton_lattice_spacing * i) * UP
-                )
-                proton_group.add(proton)
-                protons[j, i] = proton
+        protons = ParticleLattice(get_proton_template(), proton_lattice_width, proton_lattice_height, proton_lattice_spacing)
+        proton_group = protons
 
         proton_group.shift(0.5 * DOWN)
 
@@ -437,22 +1376,26 @@ class ProtonLattice(Scene):
 
         self.wait()
 
+        # Every ion sits on a spring network and is pulled toward the electrons
+        lattice_dynamics = LatticeDynamics(protons.get_positions(), proton_lattice_width, proton_lattice_height)
+        electrons = [first_electron]
+
+        def lattice_distortion(lattice: ParticleLattice, dt):
+            lattice_dynamics.advance(dt, [electron.get_center() for electron in electrons])
+            lattice.set_positions(lattice_dynamics.get_positions())
+
+        protons.add_updater(lattice_distortion)
+
         self.play(first_electron.animate.shift(8.0 * RIGHT), run_time=2)
 
         self.wait()
 
-        # Move all 4 protons in
+        # Nearest 4 protons
         # 42, 52
         # 41, 51
-        proton_shift_spacing = 0.15
-
         proton_influence_circle = Circle(radius=1.5, color=RED, fill_opacity=0.1).move_to(first_electron.get_center())
 
         proton_move_in = AnimationGroup(
-            protons[4, 1].animate.shift(proton_shift_spacing * RIGHT + proton_shift_spacing * UP),
-            protons[4, 2].animate.shift(proton_shift_spacing * RIGHT + proton_shift_spacing * DOWN),
-            protons[5, 1].animate.shift(proton_shift_spacing * LEFT + proton_shift_spacing * UP),
-            protons[5, 2].animate.shift(proton_shift_spacing * LEFT + proton_shift_spacing * DOWN),
             Create(Arrow(protons[4, 1].get_center(), proton_influence_circle.get_center(), color=RED)),
             Create(Arrow(protons[4, 2].get_center(), proton_influence_circle.get_center(), color=RED)),
             Create(Arrow(protons[5, 1].get_center(), proton_influence_circle.get_center(), color=RED)),
@@ -469,6 +1412,8 @@ class ProtonLattice(Scene):
 
         self.play(second_electron_animation_group)
 
+        electrons.append(second_electron)
+
         self.wait()
 
         self.play(second_electron.animate.shift(6.0 * RIGHT))
@@ -477,23 +1422,23 @@ class ProtonLattice(Scene):
 
         self.play(Create(Line(first_electron.get_center(), second_electron.get_center(), color=BLUE).set_z_index(first_electron.z_index - 1)))
 
-        self.play(Write(Text("Cooper Pair", color=BLUE).scale(0.5).next_to(second_electron, 0.75 * LEFT)))
+        self.play(Write(cached_text("Cooper Pair", color=BLUE).scale(0.5).next_to(second_electron, 0.75 * LEFT)))
 
         self.wait()
 
-class ElectronPairs(Scene):
+class ElectronPairs(GlyphCacheScene):
     def construct(self):
-        scene_label = Text("Net Spin in Electron Pairs").shift(3.25 * UP)
+        scene_label = cached_text("Net Spin in Electron Pairs").shift(3.25 * UP)
 
         self.play(Write(scene_label))
 
         self.wait()
 
         first_electron = Circle(radius=1, color=GOLD, fill_opacity=0.5).move_to(2 * LEFT + 0.5 * DOWN)
-        first_electron_label = MathTex("\\pm \\frac{1}{2}").move_to(first_electron.get_center())
+        first_electron_label = cached_math_tex("\\pm \\frac{1}{2}").move_to(first_electron.get_center())
 
         second_electron = Circle(radius=1, color=GOLD, fill_opacity=0.5).move_to(2 * RIGHT + 0.5 * DOWN)
-        second_electron_label = MathTex("\\pm \\frac{1}{2}").move_to(second_electron.get_center())
+        second_electron_label = cached_math_tex("\\pm \\frac{1}{2}").move_to(second_electron.get_center())
 
         electron_creation_animation_group = AnimationGroup(
             Create(first_electron),
@@ -507,11 +1452,11 @@ class ElectronPairs(Scene):
         self.wait()
 
         spin_rectangle = Rectangle(color=BLUE, fill_opacity=0).surround(VGroup(first_electron, second_electron))
-        spin_label = Tex("Net Spin: +0", color=BLUE).next_to(spin_rectangle, LEFT)
+        spin_label = cached_tex("Net Spin: +0", color=BLUE).next_to(spin_rectangle, LEFT)
 
         electron_zero_spin_animation_group = AnimationGroup(
-            first_electron_label.animate.become(MathTex("-\\frac{1}{2}").shift(1.5 * LEFT + 0.5 * DOWN)),
-            second_electron_label.animate.become(MathTex("+\\frac{1}{2}").shift(1.5 * RIGHT + 0.5 * DOWN)),
+            first_electron_label.animate.become(cached_math_tex("-\\frac{1}{2}").shift(1.5 * LEFT + 0.5 * DOWN)),
+            second_electron_label.animate.become(cached_math_tex("+\\frac{1}{2}").shift(1.5 * RIGHT + 0.5 * DOWN)),
             first_electron.animate.shift(0.5 * RIGHT),
             second_electron.animate.shift(0.5 * LEFT),
             Create(spin_rectangle),
@@ -523,8 +1468,8 @@ class ElectronPairs(Scene):
         self.wait()
 
         electron_zero_arrow_spin_animation_group = AnimationGroup(
-            first_electron_label.animate.become(MathTex("\\uparrow").shift(first_electron.get_center())),
-            second_electron_label.animate.become(MathTex("\\downarrow").shift(second_electron.get_center())),
+            first_electron_label.animate.become(cached_math_tex("\\uparrow").shift(first_electron.get_center())),
+            second_electron_label.animate.become(cached_math_tex("\\downarrow").shift(second_electron.get_center())),
         )
 
         self.play(electron_zero_arrow_spin_animation_group)
@@ -532,9 +1477,9 @@ class ElectronPairs(Scene):
         self.wait()
 
         electron_one_spin_animation_group = AnimationGroup(
-            first_electron_label.animate.become(MathTex("\\uparrow").move_to(first_electron.get_center())),
-            second_electron_label.animate.become(MathTex("\\uparrow").move_to(second_electron.get_center())),
-            spin_label.animate.become(Tex("Net Spin: +1", color=BLUE).move_to(spin_label.get_center()))
+            first_electron_label.animate.become(cached_math_tex("\\uparrow").move_to(first_electron.get_center())),
+            second_electron_label.animate.become(cached_math_tex("\\uparrow").move_to(second_electron.get_center())),
+            spin_label.animate.become(cached_tex("Net Spin: +1", color=BLUE).move_to(spin_label.get_center()))
         )
 
         self.play(electron_one_spin_animation_group)
@@ -542,9 +1487,9 @@ class ElectronPairs(Scene):
         self.wait()
 
         electron_neg_one_arrow_spin_animation_group = AnimationGroup(
-            first_electron_label.animate.become(MathTex("\\downarrow").move_to(first_electron.get_center())),
-            second_electron_label.animate.become(MathTex("\\downarrow").move_to(second_electron.get_center())),
-            spin_label.animate.become(Tex("Net Spin: -1", color=BLUE).move_to(spin_label.get_center()))
+            first_electron_label.animate.become(cached_math_tex("\\downarrow").move_to(first_electron.get_center())),
+            second_electron_label.animate.become(cached_math_tex("\\downarrow").move_to(second_electron.get_center())),
+            spin_label.animate.become(cached_tex("Net Spin: -1", color=BLUE).move_to(spin_label.get_center()))
         )
 
         self.play(electron_neg_one_arrow_spin_animation_group)
@@ -552,9 +1497,9 @@ class ElectronPairs(Scene):
         self.wait()
 
 
-class ProtonLatticeCooperPair(Scene):
+class ProtonLatticeCooperPair(GlyphCacheScene):
     def construct(self):
-        scene_label = Text("Cooper Pairs").shift(3.25 * UP)
+        scene_label = cached_text("Cooper Pairs").shift(3.25 * UP)
 
         self.play(Write(scene_label))
 
@@ -565,18 +1510,9 @@ class ProtonLatticeCooperPair(Scene):
 
         proton_lattice_spacing = 1.5
 
-        protons = np.empty((proton_lattice_width, proton_lattice_height), dtype=VGroup)
-        proton_group = VGroup()
-        for i in range(proton_lattice_height):
-            for j in range(proton_lattice_width):
-                proton, proton_animation_group = make_proton()
-                proton.move_to(    
-                    ((-(proton_lattice_width-1) * proton_lattice_spacing/2.0) + proton_lattice_spacing * j) * RIGHT + 
-                    ((-(proton_lattice_height-1) * proton_lattice_spacing/2.0) + proton_lattice_spacing * i) * UP
-                )
-                proton.set_z_index(0)
-                proton_group.add(proton)
-                protons[j, i] = proton
+        protons = ParticleLattice(get_proton_template(), proton_lattice_width, proton_lattice_height, proton_lattice_spacing)
+        proton_group = protons
+        proton_group.set_z_index(0)
 
         proton_group.shift(0.5 * DOWN)
 
@@ -591,18 +1527,22 @@ class ProtonLatticeCooperPair(Scene):
         
         self.play(first_electron_animation_group)
 
-        # Move all 4 protons in
+        # Every ion sits on a spring network and is pulled toward the electrons
+        lattice_dynamics = LatticeDynamics(protons.get_positions(), proton_lattice_width, proton_lattice_height)
+        electrons = [first_electron]
+
+        def lattice_distortion(lattice: ParticleLattice, dt):
+            lattice_dynamics.advance(dt, [electron.get_center() for electron in electrons])
+            lattice.set_positions(lattice_dynamics.get_positions())
+
+        protons.add_updater(lattice_distortion)
+
+        # Nearest 4 protons
         # 42, 52
         # 41, 51
-        proton_shift_spacing = 0.15
-
         proton_influence_circle = Circle(radius=1.5, color=RED, fill_opacity=0.1).move_to(first_electron.get_center())
 
         proton_move_in = AnimationGroup(
-            protons[4, 1].animate.shift(proton_shift_spacing * RIGHT + proton_shift_spacing * UP),
-            protons[4, 2].animate.shift(proton_shift_spacing * RIGHT + proton_shift_spacing * DOWN),
-            protons[5, 1].animate.shift(proton_shift_spacing * LEFT + proton_shift_spacing * UP),
-            protons[5, 2].animate.shift(proton_shift_spacing * LEFT + proton_shift_spacing * DOWN),
             Create(Arrow(protons[4, 1].get_center(), proton_influence_circle.get_center(), color=RED)),
             Create(Arrow(protons[4, 2].get_center(), proton_influence_circle.get_center(), color=RED)),
             Create(Arrow(protons[5, 1].get_center(), proton_influence_circle.get_center(), color=RED)),
@@ -620,6 +1560,8 @@ class ProtonLatticeCooperPair(Scene):
 
         self.play(second_electron_animation_group)
 
+        electrons.append(second_electron)
+
         self.wait()
 
         self.play(second_electron.animate.shift(6.0 * RIGHT))
@@ -630,15 +1572,15 @@ class ProtonLatticeCooperPair(Scene):
         
         self.play(Create(cooper_pair_line))
 
-        cooper_pair_label = Text("Cooper Pair", color=BLUE).scale(0.5).next_to(second_electron, 0.75 * LEFT)
+        cooper_pair_label = cached_text("Cooper Pair", color=BLUE).scale(0.5).next_to(second_electron, 0.75 * LEFT)
 
         self.play(Write(cooper_pair_label))
 
         self.wait()
 
         electron_charge_label_to_spin = AnimationGroup(
-            first_electron[1].animate.become(MathTex("\\uparrow").scale(0.5).move_to(first_electron.get_center())),
-            second_electron[1].animate.become(MathTex("\\downarrow").scale(0.5).move_to(second_electron.get_center())),
+            first_electron[1].animate.become(cached_math_tex("\\uparrow").scale(0.5).move_to(first_electron.get_center())),
+            second_electron[1].animate.become(cached_math_tex("\\downarrow").scale(0.5).move_to(second_electron.get_center())),
         )
 
         self.play(electron_charge_label_to_spin)
@@ -654,7 +1596,7 @@ class ProtonLatticeCooperPair(Scene):
         move_cooper_pair = AnimationGroup(
             second_electron.animate.move_to(second_electron.get_center() + relative_move_position),
             cooper_pair_line.animate.become(Line(first_electron.get_center(), second_electron.get_center() + relative_move_position, color=BLUE).set_z_index(first_electron.z_index - 1)),
-            cooper_pair_label.animate.become(Text("Cooper Pair", color=BLUE).scale(0.5).move_to(cooper_pair_label.get_center() + relative_move_position))
+            cooper_pair_label.animate.become(cached_text("Cooper Pair", color=BLUE).scale(0.5).move_to(cooper_pair_label.get_center() + relative_move_position))
         )
 
         self.play(move_cooper_pair)
@@ -665,7 +1607,7 @@ class ProtonLatticeCooperPair(Scene):
         move_cooper_pair = AnimationGroup(
             second_electron.animate.move_to(second_electron.get_center() + relative_move_position),
             cooper_pair_line.animate.become(Line(first_electron.get_center(), second_electron.get_center() + relative_move_position, color=BLUE).set_z_index(first_electron.z_index - 1)),
-            cooper_pair_label.animate.become(Text("Cooper Pair", color=BLUE).scale(0.5).move_to(cooper_pair_label.get_center() + relative_move_position))
+            cooper_pair_label.animate.become(cached_text("Cooper Pair", color=BLUE).scale(0.5).move_to(cooper_pair_label.get_center() + relative_move_position))
         )
 
         self.play(move_cooper_pair)
@@ -682,357 +1624,806 @@ class ProtonLatticeCooperPair(Scene):
 
         self.wait()
 
-def construct_flow_line_arrow(start, stop, endpoint_value, deviation_point, deviation_value, color=BLUE):
-    first_section = CubicBezier(start, start + endpoint_value * UP, deviation_point + deviation_value * DOWN, deviation_point, color=color)
-    second_section = CubicBezier(deviation_point, deviation_point + deviation_value * UP, stop + endpoint_value * DOWN, stop, color=color)
+def get_field_directions(func, points):
+    vectors = evaluate_field(func, points)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
+
+def trace_streamlines(func, seeds, max_length=3.0, initial_step=0.05, min_step=1e-3, max_step=0.25, tolerance=1e-4, max_steps=2000, stop_func=None, boundary=None):
+    positions = np.array(seeds, dtype=float).reshape(-1, 3)
+    steps = np.full(len(positions), initial_step)
+    lengths = np.zeros(len(positions))
+    active = np.ones(len(positions), dtype=bool)
+    headings = np.zeros_like(positions)
+    polylines = [[position.copy()] for position in positions]
+
+    def get_directions(points):
+        directions = get_field_directions(func, points)
+        if boundary is None:
+            return directions
+
+        # Next to a solid body only the motion along its surface is kept
+        directions = boundary.slide(points, directions)
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        return np.divide(directions, norms, out=np.zeros_like(directions), where=norms != 0)
+
+    def rk4(points, step):
+        step = step[:, np.newaxis]
+        k1 = get_directions(points)
+        k2 = get_directions(points + step / 2 * k1)
+        k3 = get_directions(points + step / 2 * k2)
+        k4 = get_directions(points + step * k3)
+        return points + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+    for _ in range(max_steps):
+        indices = np.flatnonzero(active)
+        if len(indices) == 0:
+            break
+
+        points = positions[indices]
+        step = np.minimum(steps[indices], max_length - lengths[indices])
+
+        # Step doubling: one full step against two half steps gives the local error
+        full_step = rk4(points, step)
+        half_step = rk4(rk4(points, step / 2), step / 2)
+        error = np.linalg.norm(full_step - half_step, axis=1)
+
+        accepted = (error <= tolerance) | (step <= min_step)
+        factor = np.clip(0.9 * (tolerance / np.maximum(error, 1e-15)) ** 0.2, 0.2, 2.0)
+        steps[indices] = np.clip(steps[indices] * factor, min_step, max_step)
+
+        accepted_indices = indices[accepted]
+        new_points = (half_step + (half_step - full_step) / 15)[accepted]
+
+        # A step that ends inside a solid body is put back on its surface, where the
+        # field is tangent, so the line slides around the body instead of dying in it
+        if boundary is not None:
+            inside = boundary.contains(new_points)
+            new_points[inside] = boundary.project_outside(new_points[inside], positions[accepted_indices[inside]])
+        offsets = new_points - positions[accepted_indices]
+        distances = np.linalg.norm(offsets, axis=1)
+        new_headings = np.divide(offsets, distances[:, np.newaxis], out=np.zeros_like(offsets), where=distances[:, np.newaxis] != 0)
+
+        # A line that doubles back on itself has fallen into a sink
+        reversed_heading = np.sum(new_headings * headings[accepted_indices], axis=1) < -0.5
+
+        positions[accepted_indices] = new_points
+        headings[accepted_indices] = new_headings
+        lengths[accepted_indices] += distances
+        for index, point in zip(accepted_indices, new_points):
+            polylines[index].append(point.copy())
+
+        stopped = (lengths[accepted_indices] >= max_length - 1e-9) | (distances < 1e-9) | reversed_heading
+        stopped |= ~np.isfinite(new_points).all(axis=1)
+        if stop_func is not None:
+            stopped |= stop_func(new_points)
+        active[accepted_indices[stopped]] = False
+
+    return [np.array(polyline) for polyline in polylines]
+
+def simplify_polyline(points, tolerance=0.005):
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+
+    segments = [(0, len(points) - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end <= start + 1:
+            continue
+
+        chord = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        chord_length = np.linalg.norm(chord)
+        if chord_length == 0:
+            distances = np.linalg.norm(offsets, axis=1)
+        else:
+            distances = np.linalg.norm(np.cross(offsets, chord), axis=1) / chord_length
+
+        farthest = np.argmax(distances)
+        if distances[farthest] > tolerance:
+            middle = start + 1 + farthest
+            keep[middle] = True
+            segments += [(start, middle), (middle, end)]
+
+    return points[keep]
+
+def fit_bezier_path(polyline, tolerance=0.005):
+    anchors = simplify_polyline(np.asarray(polyline, dtype=float), tolerance)
+    if len(anchors) < 2:
+        anchors = np.vstack([anchors, anchors])
+
+    # Catmull-Rom tangents through the simplified anchors
+    tangents = np.gradient(anchors, axis=0)
+    first_handles = anchors[:-1] + tangents[:-1] / 3
+    second_handles = anchors[1:] - tangents[1:] / 3
+
+    return np.stack([anchors[:-1], first_handles, second_handles, anchors[1:]], axis=1).reshape(-1, 3)
+
+def construct_traced_flow_line_arrow(polyline, color=BLUE):
+    flow_line = VMobject(color=color)
+    flow_line.set_points(fit_bezier_path(polyline))
+
+    end_direction = polyline[-1] - polyline[-2] if len(polyline) > 1 else UP
+    arrow_tip = RegularPolygon(n=3, start_angle=PI/2, fill_opacity=1, color=color).scale_to_fit_width(0.1)
+    arrow_tip.rotate(np.arctan2(end_direction[1], end_direction[0]) - PI/2).move_to(polyline[-1])
+
+    return VGroup(flow_line, arrow_tip)
+
+def get_flow_line_arrows(func, seeds, color=BLUE, **kwargs):
+    return VGroup(*[
+        construct_traced_flow_line_arrow(polyline, color=color)
+        for polyline in trace_streamlines(func, seeds, **kwargs)
+    ])
+
+def clip_polygon(vertices, normal, offset):
+    # The part of a convex polygon with points . normal <= offset
+    clipped = []
+    for vertex, next_vertex in zip(vertices, np.roll(vertices, -1, axis=0)):
+        distance, next_distance = vertex @ normal - offset, next_vertex @ normal - offset
+        if distance <= 0:
+            clipped.append(vertex)
+        if distance * next_distance < 0:
+            clipped.append(vertex + distance / (distance - next_distance) * (next_vertex - vertex))
+    return np.array(clipped).reshape(-1, 3)
+
+class MeissnerFieldSolver:
+    def __init__(self, superconductor, panel_spacing=0.03, charge_depth=None, oversampling=3, flux_tubes=(), flux_tube_width=0.2):
+        # Method of fundamental solutions: image charges sit just inside the
+        # boundary and are fitted so that B . n = 0 on it. Collocation points
+        # are oversampled relative to the charges to keep the fit well conditioned
+        vertices = np.array(superconductor.get_vertices(), dtype=float)
+        edges = np.roll(vertices, -1, axis=0) - vertices
+        if np.cross(edges, np.roll(edges, -1, axis=0))[:, 2].sum() < 0:
+            vertices = vertices[::-1]
+
+        # Pinned flux tubes are normal channels running vertically through the body.
+        # They cut it into solid pieces, and flux passes between the pieces
+        bodies = [vertices]
+        for tube in np.reshape(flux_tubes, (-1, 3)):
+            bodies = [
+                piece for body in bodies
+                for piece in (clip_polygon(body, RIGHT, tube[0] - flux_tube_width / 2), clip_polygon(body, LEFT, -tube[0] - flux_tube_width / 2))
+                if len(piece) >= 3
+            ]
+
+        # Faces of every piece, stored piece after piece
+        self.vertices = np.concatenate(bodies)
+        self.edges = np.concatenate([np.roll(body, -1, axis=0) - body for body in bodies])
+        self.edge_normals = np.stack([self.edges[:, 1], -self.edges[:, 0], np.zeros(len(self.edges))], axis=1)
+        self.edge_normals /= np.linalg.norm(self.edge_normals, axis=1, keepdims=True)
+        self.body_starts = np.cumsum([0] + [len(body) for body in bodies[:-1]])
+        self.face_bodies = np.repeat(np.arange(len(bodies)), [len(body) for body in bodies])
+
+        self.collocation_points, self.normals = self.get_boundary_points(panel_spacing / oversampling)
+
+        charge_depth = panel_spacing if charge_depth is None else charge_depth
+        boundary_points, boundary_normals = self.get_boundary_points(panel_spacing)
+        self.charge_points = boundary_points - charge_depth * boundary_normals
+        self.core_radius = charge_depth / 2
+
+        # Normal field at every collocation point per unit image charge, plus
+        # a zero net charge row so no flux is created inside the superconductor
+        unit_fields = np.stack([
+            get_force_field_batch(self.collocation_points, charge_point, 1.0, self.core_radius)
+            for charge_point in self.charge_points
+        ], axis=1)
+        normal_response = np.einsum("nk,nmk->nm", self.normals, unit_fields)
+        system = np.vstack([normal_response, np.ones(len(self.charge_points))])
+
+        self.solve_matrix = np.linalg.pinv(system, rcond=1e-10)
+
+    def get_boundary_points(self, spacing):
+        points = []
+        normals = []
+        for vertex, edge, normal in zip(self.vertices, self.edges, self.edge_normals):
+            num_of_panels = max(2, int(np.ceil(np.linalg.norm(edge) / spacing)))
+            offsets = (np.arange(num_of_panels) + 0.5) / num_of_panels
+            points.append(vertex + offsets[:, np.newaxis] * edge)
+            normals.append(np.repeat(normal[np.newaxis], num_of_panels, axis=0))
+
+        return np.concatenate(points), np.concatenate(normals)
+
+    def get_face_distances(self, points):
+        # Signed distance of every point to every face line, and per piece the
+        # largest of those, which is negative exactly inside that piece
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        offsets = points[:, np.newaxis, :] - self.vertices[np.newaxis, :, :]
+        face_distances = np.einsum("nmk,mk->nm", offsets, self.edge_normals)
+        return face_distances, np.maximum.reduceat(face_distances, self.body_starts, axis=1)
+
+    def get_nearest_faces(self, face_distances, bodies):
+        # The face of the given piece each point is farthest outside of
+        in_body = self.face_bodies[np.newaxis, :] == np.asarray(bodies)[:, np.newaxis]
+        return np.argmax(np.where(in_body, face_distances, -np.inf), axis=1)
+
+    def contains(self, points):
+        return np.any(self.get_face_distances(points)[1] < 0, axis=1)
+
+    def slide(self, points, vectors, shell=0.02):
+        # Drops the part of each vector heading into the nearest face, within a thin
+        # shell around the body. The fitted field is only tangent up to the panel size,
+        # and near the corners that is enough to steer a traced line into the body
+        face_distances, body_distances = self.get_face_distances(points)
+        faces = self.get_nearest_faces(face_distances, np.argmin(body_distances, axis=1))
+
+        normals = self.edge_normals[faces]
+        inward = np.minimum(np.einsum("nk,nk->n", vectors, normals), 0)
+        inward[face_distances[np.arange(len(faces)), faces] > shell] = 0
+        return vectors - inward[:, np.newaxis] * normals
+
+    def project_outside(self, points, previous_points, offset=1e-3):
+        # Back onto the face each step came in through, the one of the piece it landed
+        # in that its previous point was outside of, keeping only the motion along it
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        bodies = np.argmin(self.get_face_distances(points)[1], axis=1)
+        faces = self.get_nearest_faces(self.get_face_distances(previous_points)[0], bodies)
+
+        normals = self.edge_normals[faces]
+        distances = np.einsum("nk,nk->n", points - self.vertices[faces], normals)
+        return points - (distances - offset)[:, np.newaxis] * normals
+
+    def solve(self, func):
+        external_normal_field = np.einsum("nk,nk->n", self.normals, evaluate_field(func, self.collocation_points))
+        return self.solve_matrix @ np.append(-external_normal_field, 0.0)
+
+    def get_field_func(self, func, charges, blend=1.0):
+        # Blends linearly between the normal state (blend=0) and full expulsion (blend=1)
+        induced_func = get_force_field_func(
+            *zip(self.charge_points, blend * charges), radius=self.core_radius
+        )
 
-    arrow_tip = RegularPolygon(n=3, start_angle=PI/2, fill_opacity=1, color=color).scale_to_fit_width(0.1).move_to(stop)
+        def batch(points):
+            points = np.asarray(points, dtype=float).reshape(-1, 3)
+            values = evaluate_field(func, points) + induced_func.batch(points)
 
-    return VGroup(first_section, second_section, arrow_tip)
+            inside = self.contains(points)
+            values[inside] = (1 - blend) * evaluate_field(func, points[inside])
+            return values
 
-class MagneticFieldsThroughSuperconductor(Scene):
-    def construct(self):
-        scene_label = Text("Meissner Effect").shift(3.25 * UP)
+        def expelled_func(point):
+            return batch(point)[0]
 
-        self.play(Write(scene_label))
+        expelled_func.batch = batch
+        return expelled_func
 
-        self.wait()
+@functools.lru_cache(maxsize=None)
+def get_superconductor_intro_mobjects(magnet_width=4.0, magnet_height=1.0, magnet_position=-2.0, line_length=3):
+    magnet = Rectangle(height=magnet_height - 0.25, width=magnet_width + 0.5, color=GREY, fill_opacity=0.7).move_to(magnet_position * UP).set_z_index(1)
+    superconductor = Rectangle(height=0.5, width=1.5, color=GOLD, fill_opacity=0.8).move_to((magnet_position + 2) * UP).set_z_index(10)
 
-        self.play(FadeOut(scene_label))
+    magnet_label = cached_text("Magnet", color=GREY).scale(0.5).next_to(magnet, 0.75 * LEFT)
+    superconductor_label = cached_text("Superconductor", color=GOLD).scale(0.5).next_to(superconductor, 0.75 * LEFT)
 
-        self.wait()
+    func = get_force_field_func(
+        (magnet_position * UP + (magnet_height / 2) * UP, +2), (magnet_position * UP + (magnet_height / 2) * DOWN, -2)
+    )
 
-        magnet_width = 4.0
-        magnet_height = 1.0
+    magnet_vector_field = ArrowVectorField(get_sampled_field_func(func)).set_z_index(0)
 
-        magnet_position = -2.0
+    # Field lines leave the north pole evenly spread over the upper half plane
+    num_of_traced_flow_lines = 24
+    north_pole = magnet_position * UP + (magnet_height / 2) * UP
+    seed_angles = np.linspace(PI / 12, 11 * PI / 12, num_of_traced_flow_lines)
+    seeds = [north_pole + 0.3 * (np.cos(angle) * RIGHT + np.sin(angle) * UP) for angle in seed_angles]
 
-        magnet = Rectangle(height=magnet_height - 0.25, width=magnet_width + 0.5, color=GREY, fill_opacity=0.7).move_to(magnet_position * UP).set_z_index(1)
+    flow_line_arrows = get_flow_line_arrows(func, seeds, max_length=line_length)
 
-        self.play(Create(magnet))
+    ax = Axes(
+        x_range=[0, 3, 0.5], y_range=[0, 3, 0.5], x_length=3, y_length=2, axis_config={"include_tip": False}
+    )
 
-        self.wait()
+    ax.shift(2 * UP + 4.5 * RIGHT)
+    labels = ax.get_axis_labels(cached_text("Temperature").scale(0.4), cached_text("Resistivity").scale(0.4))
 
-        superconductor = Rectangle(height=0.5, width=1.5, color=GOLD, fill_opacity=0.8).move_to((magnet_position + 2) * UP).set_z_index(10)
+    resistivity = SuperconductorResistivity(
+        NormalMetalResistivity(residual_resistivity=1.5, coupling=2.8, debye_temperature=1.5), critical_temperature=0.5
+    )
 
-        self.play(Create(superconductor))
+    nonlinear_graph_section = ax.plot(resistivity.normal_resistivity, color=GOLD, x_range=[0.5, 3])
+    t_label = ax.get_T_label(x_val=0.5, graph=nonlinear_graph_section, line_color=GOLD, label=cached_tex("$T_{C}$").scale(0.75))
+    linear_graph_section = ax.plot(lambda x: resistivity.superconducting_value, color=GOLD, x_range=[0, 0.5])
+
+    return {
+        "magnet": magnet,
+        "superconductor": superconductor,
+        "magnet_label": magnet_label,
+        "superconductor_label": superconductor_label,
+        "magnet_field_func": func,
+        "magnet_vector_field": magnet_vector_field,
+        "seeds": seeds,
+        "flow_line_arrows": flow_line_arrows,
+        "ax": ax,
+        "labels": labels,
+        "resistivity": resistivity,
+        "nonlinear_graph_section": nonlinear_graph_section,
+        "t_label": t_label,
+        "linear_graph_section": linear_graph_section
+    }
+
+class SuperconductorScene(GlyphCacheScene):
+    magnet_width = 4.0
+    magnet_height = 1.0
+    magnet_position = -2.0
+    line_length = 3
+    partial_movie_group = "SuperconductorIntro"
+
+    def __init__(self, *args, **kwargs):
+        with tempconfig(self.get_partial_movie_config()):
+            super().__init__(*args, **kwargs)
+
+    def render(self, *args, **kwargs):
+        with tempconfig(self.get_partial_movie_config()):
+            return super().render(*args, **kwargs)
+
+    def get_partial_movie_config(self):
+        # Every superconductor scene opens with the same animations, so with caching on
+        # their partial movies share one directory named after the group, and the intro
+        # is only rendered by the first scene. Uncached partial movies are numbered per
+        # scene and must stay apart
+        if config["disable_caching"]:
+            return {}
+        return {"partial_movie_dir": str(config["partial_movie_dir"]).replace("{scene_name}", self.partial_movie_group)}
+
+    def play_intro(self, title):
+        intro_mobjects = get_superconductor_intro_mobjects(self.magnet_width, self.magnet_height, self.magnet_position, self.line_length)
+        for name, value in intro_mobjects.items():
+            setattr(self, name, value.copy() if isinstance(value, Mobject) else value)
+
+        scene_label = cached_text(title).shift(3.25 * UP)
+
+        self.play(Write(scene_label))
 
         self.wait()
 
-        magnet_label = Text("Magnet", color=GREY).scale(0.5).next_to(magnet, 0.75 * LEFT)
-        superconductor_label = Text("Superconductor", color=GOLD).scale(0.5).next_to(superconductor, 0.75 * LEFT)
+        self.play(FadeOut(scene_label))
 
-        label_group = AnimationGroup(
-            Write(magnet_label),
-            Write(superconductor_label)
-        )
+        self.wait()
 
-        self.play(label_group)
+        self.play(Create(self.magnet))
+
+        self.wait()
+
+        self.play(Create(self.superconductor))
 
         self.wait()
 
         label_group = AnimationGroup(
-            FadeOut(magnet_label),
-            FadeOut(superconductor_label)
+            Write(self.magnet_label),
+            Write(self.superconductor_label)
         )
 
         self.play(label_group)
 
         self.wait()
 
-        func = get_force_field_func(
-            (magnet_position * UP + (magnet_height / 2) * UP, +2), (magnet_position * UP + (magnet_height / 2) * DOWN, -2)
+        label_group = AnimationGroup(
+            FadeOut(self.magnet_label),
+            FadeOut(self.superconductor_label)
         )
 
-        magnet_vector_field = ArrowVectorField(func).set_z_index(0)
-
-        self.play(FadeIn(magnet_vector_field))
+        self.play(label_group)
 
         self.wait()
 
-        flow_line_arrows = VGroup()
-
-        num_of_flow_line_arrows = 9
-        line_spacing = magnet_width / num_of_flow_line_arrows
-        line_length = 3
-
-        def make_straight_arrow(arrow_number):
-            flow_line_arrows.add(
-                construct_flow_line_arrow(
-                    start=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2) * UP,
-                    stop=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + line_length) * UP,
-                    endpoint_value=0.5,
-                    deviation_point=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + (line_length / 2)) * UP,
-                    deviation_value=0.5
-                )
-            )
-
-        for i in range(num_of_flow_line_arrows + 1):
-            make_straight_arrow(i)
-
-    
-        self.play(Transform(magnet_vector_field, flow_line_arrows))
+        self.play(FadeIn(self.magnet_vector_field))
 
         self.wait()
 
-        flow_line_curvy_arrows = VGroup()
-
-        def make_curvy_arrow(arrow_number, blocker_ammount, endpoint_value, deviation_value):
-            flow_line_curvy_arrows.add(
-                construct_flow_line_arrow(
-                    start=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2) * UP,
-                    stop=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + line_length) * UP,
-                    endpoint_value=endpoint_value,
-                    deviation_point=(magnet_width/2 - (line_spacing * arrow_number) - blocker_ammount) * LEFT + (magnet_position + magnet_height/2 + (line_length / 2)) * UP,
-                    deviation_value=deviation_value
-                )
-            )
-
-        make_curvy_arrow(0, 0, 0.5, 0.5)
-        make_curvy_arrow(1, 0, 0.5, 0.5)
-        make_curvy_arrow(2, 0, 0.5, 0.5)
+        self.play(Transform(self.magnet_vector_field, self.flow_line_arrows))
 
-        make_curvy_arrow(3, -0.3, 0.5, 0.5)
-        make_curvy_arrow(4, -0.65, 0.5, 0.7)
-        make_curvy_arrow(5, 0.65, 0.5, 0.7)
-        make_curvy_arrow(6, 0.3, 0.5, 0.5)
-
-        make_curvy_arrow(7, 0, 0.5, 0.5)
-        make_curvy_arrow(8, 0, 0.5, 0.5)
-        make_curvy_arrow(9, 0, 0.5, 0.5)
-
-
-        temprature_value = ValueTracker(3)
-        temprature_value.set_value(3)
-
-        ax = Axes(
-            x_range=[0, 3, 0.5], y_range=[0, 3, 0.5], x_length=3, y_length=2, axis_config={"include_tip": False}
-        ) 
+        self.wait()
 
-        ax.shift(2 * UP + 4.5 * RIGHT)
-        labels = ax.get_axis_labels(Text("Temperature").scale(0.4), Text("Resistivity").scale(0.4))
+        self.temprature_value = ValueTracker(3)
+        self.dot = GraphTrackerDot(self.ax, self.temprature_value, self.resistivity)
 
-        def func(x):
-            return 1.5 + (0.4 * x)**3 # Sketchy Plot
+        self.play(Create(self.ax))
+        self.play(Write(self.labels))
+        self.play(Create(self.nonlinear_graph_section))
+        self.play(Create(self.t_label))
+        self.play(Create(self.linear_graph_section))
+        self.play(Create(self.dot))
 
-        nonlinear_graph_section = ax.plot(func, color=GOLD, x_range=[0.5, 3])
-        t_label = ax.get_T_label(x_val=0.5, graph=nonlinear_graph_section, line_color=GOLD, label=Tex("$T_{C}$").scale(0.75))
-        linear_graph_section = ax.plot(lambda x: 0.001, color=GOLD, x_range=[0, 0.5])
+        self.wait()
 
-        initial_point = [ax.coords_to_point(temprature_value.get_value(), func(temprature_value.get_value()))]
-        dot = Dot(point=initial_point)
-        def tracker_dot_position(x: Dot):
-            if ax.p2c(x.get_center())[0] > 0.5:
-                x.move_to(ax.c2p(temprature_value.get_value(), func(temprature_value.get_value())))
-            else:
-                x.move_to(ax.c2p(temprature_value.get_value(), 0.001))
+class MagneticFieldsThroughSuperconductor(SuperconductorScene):
+    def construct(self):
+        self.play_intro("Meissner Effect")
 
-        dot.add_updater(tracker_dot_position)
+        magnet_vector_field = self.magnet_vector_field
+        temprature_value = self.temprature_value
 
-        self.play(Create(ax))
-        self.play(Write(labels))
-        self.play(Create(nonlinear_graph_section))
-        self.play(Create(t_label))
-        self.play(Create(linear_graph_section))
-        self.play(Create(dot))
+        # Solved once for this geometry. Lines are traced only in the normal and fully
+        # expelled states, the expulsion itself morphs from one set to the other
+        meissner_solver = MeissnerFieldSolver(self.superconductor)
+        magnet_field_func = self.magnet_field_func
+        induced_charges = meissner_solver.solve(magnet_field_func)
 
-        self.wait()
+        expelled_func = meissner_solver.get_field_func(magnet_field_func, induced_charges)
+        expelled_flow_lines = get_flow_line_arrows(expelled_func, self.seeds, max_length=self.line_length, boundary=meissner_solver)
+        normal_flow_lines = self.flow_line_arrows.copy()
 
         self.play(temprature_value.animate.set_value(0.5 - 1e-6), run_time=5)
-        self.play(Transform(magnet_vector_field, flow_line_curvy_arrows))
+        self.play(Transform(magnet_vector_field, expelled_flow_lines))
 
         self.play(temprature_value.animate.set_value(0.1), run_time=2)
 
         self.play(temprature_value.animate.set_value(0.5 + 1e-6), run_time=2)
         
-        self.play(Transform(magnet_vector_field, flow_line_arrows))
+        self.play(Transform(magnet_vector_field, normal_flow_lines))
+
         self.play(temprature_value.animate.set_value(3), run_time=5)
 
         self.wait()
 
-class SuperconductorFluxPinning(Scene):
+def find_neighbor_pairs(positions, cutoff, targets=None):
+    # Cell list search: only sources in the 3x3 block of cells around each
+    # target are tested, so cost grows with N instead of N^2
+    sources = np.asarray(positions, dtype=float).reshape(-1, 2)
+    queries = sources if targets is None else np.asarray(targets, dtype=float).reshape(-1, 2)
+    if len(sources) == 0 or len(queries) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    origin = np.minimum(sources.min(axis=0), queries.min(axis=0))
+    source_cells = np.floor((sources - origin) / cutoff).astype(int)
+    query_cells = np.floor((queries - origin) / cutoff).astype(int)
+    grid_shape = np.maximum(source_cells.max(axis=0), query_cells.max(axis=0)) + 1
+
+    source_ids = source_cells[:, 0] * grid_shape[1] + source_cells[:, 1]
+    order = np.argsort(source_ids, kind="stable")
+    cell_counts = np.bincount(source_ids, minlength=grid_shape[0] * grid_shape[1])
+    cell_starts = np.cumsum(cell_counts) - cell_counts
+
+    # Self pairs only need half of the neighbor shell, each pair is then found once
+    if targets is None:
+        offsets = [(0, 0), (0, 1), (1, -1), (1, 0), (1, 1)]
+    else:
+        offsets = list(itertools.product((-1, 0, 1), repeat=2))
+
+    query_indices = []
+    source_indices = []
+    same_cell = []
+    for offset in offsets:
+        neighbor_cells = query_cells + offset
+        valid = np.all((neighbor_cells >= 0) & (neighbor_cells < grid_shape), axis=1)
+
+        queries_in_range = np.flatnonzero(valid)
+        neighbor_ids = neighbor_cells[valid, 0] * grid_shape[1] + neighbor_cells[valid, 1]
+        counts = cell_counts[neighbor_ids]
+
+        first_slots = np.repeat(cell_starts[neighbor_ids], counts)
+        slot_offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        query_indices.append(np.repeat(queries_in_range, counts))
+        source_indices.append(order[first_slots + slot_offsets])
+        same_cell.append(np.full(counts.sum(), offset == (0, 0)))
+
+    query_indices = np.concatenate(query_indices)
+    source_indices = np.concatenate(source_indices)
+    same_cell = np.concatenate(same_cell)
+
+    distances = np.linalg.norm(queries[query_indices] - sources[source_indices], axis=1)
+    close = distances < cutoff
+    if targets is None:
+        close &= ~same_cell | (query_indices < source_indices)
+
+    return query_indices[close], source_indices[close]
+
+class VortexSimulation:
+    def __init__(self, width, height, num_of_vortices, num_of_pins, penetration_depth=1.0, interaction_strength=1.0, pin_radius=0.3, pin_strength=2.0, driving_force=ORIGIN, cutoff=None, core_radius=None, viscosity=1.0, temperature=0.0, seed=None):
+        self.size = np.array([width, height], dtype=float)
+        self.penetration_depth = penetration_depth
+        self.interaction_strength = interaction_strength
+        self.pin_radius = pin_radius
+        self.pin_strength = pin_strength
+        self.driving_force = np.array(driving_force, dtype=float)[:2]
+        # K1 has dropped below 2% of its value at one penetration depth by 4 lambda
+        self.cutoff = cutoff or 4 * penetration_depth
+        self.core_radius = core_radius or 0.1 * penetration_depth
+        self.viscosity = viscosity
+        self.temperature = temperature
+
+        self.random_generator = np.random.default_rng(seed)
+        self.positions = self.random_generator.uniform(0, self.size, (num_of_vortices, 2))
+        self.pins = self.random_generator.uniform(0, self.size, (num_of_pins, 2))
+
+    def get_forces(self):
+        forces = np.zeros_like(self.positions)
+        forces += self.driving_force
+
+        # London repulsion between vortex pairs, f(r) ~ K1(r / lambda)
+        i, j = find_neighbor_pairs(self.positions, self.cutoff)
+        offsets = self.positions[i] - self.positions[j]
+        distances = np.maximum(np.linalg.norm(offsets, axis=1), self.core_radius)
+        magnitudes = self.interaction_strength * k1(distances / self.penetration_depth)
+        pair_forces = (magnitudes / distances)[:, np.newaxis] * offsets
+
+        for axis in range(2):
+            forces[:, axis] += np.bincount(i, pair_forces[:, axis], len(self.positions))
+            forces[:, axis] -= np.bincount(j, pair_forces[:, axis], len(self.positions))
+
+        # Parabolic pinning wells
+        i, j = find_neighbor_pairs(self.pins, self.pin_radius, targets=self.positions)
+        pin_forces = -self.pin_strength / self.pin_radius * (self.positions[i] - self.pins[j])
+        for axis in range(2):
+            forces[:, axis] += np.bincount(i, pin_forces[:, axis], len(self.positions))
+
+        return forces
+
+    def step(self, dt):
+        displacements = dt / self.viscosity * self.get_forces()
+        if self.temperature > 0:
+            displacements += np.sqrt(2 * self.temperature * dt / self.viscosity) * self.random_generator.standard_normal(self.positions.shape)
+
+        # Keep close encounters from flinging vortices across the sample
+        lengths = np.linalg.norm(displacements, axis=1, keepdims=True)
+        max_displacement = 0.1 * self.penetration_depth
+        displacements *= np.minimum(1, max_displacement / np.maximum(lengths, 1e-12))
+
+        self.positions += displacements
+        np.clip(self.positions, 0, self.size, out=self.positions)
+        return self
+
+    def bake(self, num_of_frames, steps_per_frame=10, dt=0.01):
+        timeline = np.empty((num_of_frames, len(self.positions), 2))
+        for frame in range(num_of_frames):
+            timeline[frame] = self.positions
+            for _ in range(steps_per_frame):
+                self.step(dt)
+        return timeline
+
+class VortexCloud(PMobject):
+    def __init__(self, timeline, superconductor, simulation_size, color=RED, stroke_width=4, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+
+        self.timeline = timeline
+        self.corner = superconductor.get_corner(DL)
+        self.scale_factors = np.array([superconductor.width, superconductor.height]) / np.asarray(simulation_size, dtype=float)
+
+        self.add_points(self.get_scene_points(timeline[0]), color=color)
+
+    def get_scene_points(self, positions):
+        points = np.zeros((len(positions), 3))
+        points[:, :2] = positions * self.scale_factors
+        return points + self.corner
+
+    def set_frame(self, frame):
+        frame = np.clip(frame, 0, len(self.timeline) - 1)
+        lower_frame = int(np.floor(frame))
+        upper_frame = min(lower_frame + 1, len(self.timeline) - 1)
+        positions = interpolate(self.timeline[lower_frame], self.timeline[upper_frame], frame - lower_frame)
+
+        self.points[:] = self.get_scene_points(positions)
+        return self
+
+class PlayVortexTimeline(Animation):
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_frame(alpha * (len(self.mobject.timeline) - 1))
+
+@functools.lru_cache(maxsize=16)
+def get_bessel_k0_table(penetration_depth, cutoff, core_radius, num_of_samples=4096):
+    # K0 diverges at the vortex core and is truncated at the cutoff, shifted so
+    # the truncated kernel meets zero instead of stepping down to it
+    distances = np.linspace(0, cutoff, num_of_samples)
+    values = k0(np.maximum(distances, core_radius) / penetration_depth) - k0(cutoff / penetration_depth)
+    return distances, values
+
+def get_london_field_map(vortex_positions, simulation_size, resolution=(1920, 1080), penetration_depth=1.0, cutoff=None, core_radius=None):
+    width, height = simulation_size
+    pixel_width, pixel_height = resolution
+    cutoff = cutoff or 4 * penetration_depth
+    core_radius = core_radius or 0.1 * penetration_depth
+
+    # Bin the vortices onto the pixel grid, row 0 at the top of the image
+    positions = np.asarray(vortex_positions, dtype=float).reshape(-1, 2)
+    columns = np.clip((positions[:, 0] / width * pixel_width).astype(int), 0, pixel_width - 1)
+    rows = np.clip(((1 - positions[:, 1] / height) * pixel_height).astype(int), 0, pixel_height - 1)
+    vortex_counts = np.bincount(rows * pixel_width + columns, minlength=pixel_width * pixel_height)
+    vortex_counts = vortex_counts.reshape(pixel_height, pixel_width).astype(float)
+
+    # Every vortex then contributes the same tabulated kernel stamp
+    x_step = width / pixel_width
+    y_step = height / pixel_height
+    x_offsets = np.arange(-np.ceil(cutoff / x_step), np.ceil(cutoff / x_step) + 1) * x_step
+    y_offsets = np.arange(-np.ceil(cutoff / y_step), np.ceil(cutoff / y_step) + 1) * y_step
+    stamp_distances = np.hypot(y_offsets[:, np.newaxis], x_offsets[np.newaxis, :])
+
+    table_distances, table_values = get_bessel_k0_table(penetration_depth, cutoff, core_radius)
+    stamp = np.interp(stamp_distances, table_distances, table_values, right=0.0)
+
+    return oaconvolve(vortex_counts, stamp, mode="same")
+
+def get_london_field_image(field_map, color=RED, max_opacity=0.9):
+    # Transparent where there is no field, ramping up to color at the peak
+    normalized = np.clip(field_map / max(field_map.max(), 1e-12), 0, 1)
+
+    image = np.zeros(field_map.shape + (4,), dtype=np.uint8)
+    image[..., :3] = (255 * color_to_rgb(color)).astype(np.uint8)
+    image[..., 3] = (255 * max_opacity * normalized).astype(np.uint8)
+
+    return ImageMobject(image)
+
+class SuperconductorFluxPinning(SuperconductorScene):
     def construct(self):
-        scene_label = Text("Flux Pinning").shift(3.25 * UP)
+        self.play_intro("Flux Pinning")
 
-        self.play(Write(scene_label))
+        line_length = self.line_length
 
-        self.wait()
+        magnet_vector_field = self.magnet_vector_field
+        flow_line_arrows = self.flow_line_arrows
+        superconductor = self.superconductor
+        temprature_value = self.temprature_value
 
-        self.play(FadeOut(scene_label))
+        # Flux pinned in two normal tubes crosses the cooled superconductor, the rest
+        # of the field is expelled around it. Same seeds as the intro's lines
+        flux_tube_width = 0.2
+        flux_tube_centers = [superconductor.get_center() + x * RIGHT for x in (-0.45, 0.45)]
 
-        self.wait()
+        pinning_solver = MeissnerFieldSolver(superconductor, flux_tubes=flux_tube_centers, flux_tube_width=flux_tube_width)
+        pinned_func = pinning_solver.get_field_func(self.magnet_field_func, pinning_solver.solve(self.magnet_field_func))
+        pinned_flow_lines = get_flow_line_arrows(pinned_func, self.seeds, max_length=line_length, boundary=pinning_solver)
 
-        magnet_width = 4.0
-        magnet_height = 1.0
+        self.play(temprature_value.animate.set_value(0.5 - 1e-6), run_time=5)
+        self.play(Transform(magnet_vector_field, pinned_flow_lines))
 
-        magnet_position = -2.0
+        self.play(temprature_value.animate.set_value(0.1), run_time=2)
 
-        magnet = Rectangle(height=magnet_height - 0.25, width=magnet_width + 0.5, color=GREY, fill_opacity=0.7).move_to(magnet_position * UP).set_z_index(1)
+        self.wait()
 
-        self.play(Create(magnet))
+        first_flux_tube, second_flux_tube = [
+            Rectangle(height=superconductor.height, width=flux_tube_width, color=RED, fill_opacity=0.5).move_to(center).set_z_index(15)
+            for center in flux_tube_centers
+        ]
+        
+        create_flux_tubes = AnimationGroup(
+            Create(first_flux_tube),
+            Create(second_flux_tube)
+        )
 
-        self.wait()
+        self.play(create_flux_tubes)
 
-        superconductor = Rectangle(height=0.5, width=1.5, color=GOLD, fill_opacity=0.8).move_to((magnet_position + 2) * UP).set_z_index(10)
+        flux_tube_label = cached_text("Flux Tubes", color=RED).scale(0.5).next_to(first_flux_tube, 1.25 * LEFT)
 
-        self.play(Create(superconductor))
+        self.play(Write(flux_tube_label))
 
         self.wait()
 
-        magnet_label = Text("Magnet", color=GREY).scale(0.5).next_to(magnet, 0.75 * LEFT)
-        superconductor_label = Text("Superconductor", color=GOLD).scale(0.5).next_to(superconductor, 0.75 * LEFT)
-
-        label_group = AnimationGroup(
-            Write(magnet_label),
-            Write(superconductor_label)
+        flux_tube_fade_out = AnimationGroup(
+            FadeOut(first_flux_tube),
+            FadeOut(second_flux_tube),
+            FadeOut(flux_tube_label),
         )
 
-        self.play(label_group)
+        self.play(flux_tube_fade_out)
 
         self.wait()
 
-        label_group = AnimationGroup(
-            FadeOut(magnet_label),
-            FadeOut(superconductor_label)
+        # Lengths in units of the penetration depth, superconductor is 30 x 10 lambda
+        vortex_simulation = VortexSimulation(
+            width=30, height=10, num_of_vortices=400, num_of_pins=250,
+            driving_force=0.3 * RIGHT, temperature=0.01, seed=0
         )
+        vortex_timeline = vortex_simulation.bake(num_of_frames=120, steps_per_frame=5, dt=0.02)
 
-        self.play(label_group)
+        vortex_cloud = VortexCloud(vortex_timeline, superconductor, simulation_size=(30, 10)).set_z_index(15)
 
-        self.wait()
+        self.play(FadeIn(vortex_cloud))
+        self.play(PlayVortexTimeline(vortex_cloud, run_time=4, rate_func=linear))
 
-        func = get_force_field_func(
-            (magnet_position * UP + (magnet_height / 2) * UP, +2), (magnet_position * UP + (magnet_height / 2) * DOWN, -2)
+        # Rendered at the superconductor's on screen pixel size
+        field_map_resolution = (
+            int(config["pixel_width"] * superconductor.width / config["frame_width"]),
+            int(config["pixel_height"] * superconductor.height / config["frame_height"])
         )
+        field_map = get_london_field_map(vortex_timeline[-1], simulation_size=(30, 10), resolution=field_map_resolution)
 
-        magnet_vector_field = ArrowVectorField(func).set_z_index(0)
+        field_map_image = get_london_field_image(field_map)
+        field_map_image.stretch_to_fit_width(superconductor.width).stretch_to_fit_height(superconductor.height)
+        field_map_image.move_to(superconductor).set_z_index(11)
 
-        self.play(FadeIn(magnet_vector_field))
+        self.play(FadeIn(field_map_image))
 
         self.wait()
 
-        flow_line_arrows = VGroup()
+        self.play(FadeOut(vortex_cloud), FadeOut(field_map_image))
 
-        num_of_flow_line_arrows = 9
-        line_spacing = magnet_width / num_of_flow_line_arrows
-        line_length = 3
-
-        def make_straight_arrow(arrow_number):
-            flow_line_arrows.add(
-                construct_flow_line_arrow(
-                    start=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2) * UP,
-                    stop=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + line_length) * UP,
-                    endpoint_value=0.5,
-                    deviation_point=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + (line_length / 2)) * UP,
-                    deviation_value=0.5
-                )
-            )
-
-        for i in range(num_of_flow_line_arrows + 1):
-            make_straight_arrow(i)
+        self.wait()
 
-    
+        self.play(temprature_value.animate.set_value(0.5 + 1e-6), run_time=2)
+        
         self.play(Transform(magnet_vector_field, flow_line_arrows))
+        self.play(temprature_value.animate.set_value(3), run_time=5)
 
         self.wait()
 
-        flow_line_curvy_arrows = VGroup()
-
-        def make_curvy_arrow(arrow_number, blocker_ammount, endpoint_value, deviation_value):
-            flow_line_curvy_arrows.add(
-                construct_flow_line_arrow(
-                    start=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2) * UP,
-                    stop=(magnet_width/2 - (line_spacing * arrow_number)) * LEFT + (magnet_position + magnet_height/2 + line_length) * UP,
-                    endpoint_value=endpoint_value,
-                    deviation_point=(magnet_width/2 - (line_spacing * arrow_number) - blocker_ammount) * LEFT + (magnet_position + magnet_height/2 + (line_length / 2)) * UP,
-                    deviation_value=deviation_value
-                )
-            )
-
-        make_curvy_arrow(0, 0, 0.5, 0.5)
-        make_curvy_arrow(1, 0, 0.5, 0.5)
-        make_curvy_arrow(2, 0, 0.5, 0.5)
-
-        make_curvy_arrow(3, line_spacing/2, 0.5, 0.5)
-        make_curvy_arrow(4, -line_spacing/2, 0.5, 0.5)
-        make_curvy_arrow(5, line_spacing/2, 0.5, 0.5)
-        make_curvy_arrow(6, -line_spacing/2, 0.5, 0.5)
-
-        make_curvy_arrow(7, 0, 0.5, 0.5)
-        make_curvy_arrow(8, 0, 0.5, 0.5)
-        make_curvy_arrow(9, 0, 0.5, 0.5)
-
-        temprature_value = ValueTracker(3)
-        temprature_value.set_value(3)
-
-        ax = Axes(
-            x_range=[0, 3, 0.5], y_range=[0, 3, 0.5], x_length=3, y_length=2, axis_config={"include_tip": False}
-        ) 
-
-        ax.shift(2 * UP + 4.5 * RIGHT)
-        labels = ax.get_axis_labels(Text("Temperature").scale(0.4), Text("Resistivity").scale(0.4))
-
-        def func(x):
-            return 1.5 + (0.4 * x)**3 # Sketchy Plot
-
-        nonlinear_graph_section = ax.plot(func, color=GOLD, x_range=[0.5, 3])
-        t_label = ax.get_T_label(x_val=0.5, graph=nonlinear_graph_section, line_color=GOLD, label=Tex("$T_{C}$").scale(0.75))
-        linear_graph_section = ax.plot(lambda x: 0.001, color=GOLD, x_range=[0, 0.5])
-
-        initial_point = [ax.coords_to_point(temprature_value.get_value(), func(temprature_value.get_value()))]
-        dot = Dot(point=initial_point)
-        def tracker_dot_position(x: Dot):
-            if ax.p2c(x.get_center())[0] > 0.5:
-                x.move_to(ax.c2p(temprature_value.get_value(), func(temprature_value.get_value())))
-            else:
-                x.move_to(ax.c2p(temprature_value.get_value(), 0.001))
-
-        dot.add_updater(tracker_dot_position)
-
-        self.play(Create(ax))
-        self.play(Write(labels))
-        self.play(Create(nonlinear_graph_section))
-        self.play(Create(t_label))
-        self.play(Create(linear_graph_section))
-        self.play(Create(dot))
-
-        self.wait()
+class FieldVolume:
+    # Field sampled on a 3D grid in chunks of chunk_size points, so memory stays bounded
+    # however fine the grid. With memmap the samples live in the field cache on disk
+    # and only the pages being read are in RAM
+    def __init__(self, func, x_range, y_range, z_range, step=0.1, chunk_size=65536, memmap=True):
+        self.axes = [np.arange(start, stop + step / 2, step) for start, stop in (x_range, y_range, z_range)]
+        self.shape = tuple(len(axis) for axis in self.axes)
+        self.chunk_size = chunk_size
+
+        use_cache = memmap and not config["disable_caching"] and hasattr(func, "point_strength_pairs")
+        if use_cache:
+            grid_description = np.array([[axis[0], axis[-1], len(axis)] for axis in self.axes])
+            key = field_grid_cache.get_key(func.point_strength_pairs, func.radius, grid_description, getattr(func, "evaluator", None))
+            self.values = field_grid_cache.load(key)
+            if self.values is None:
+                self.values = field_grid_cache.commit(key, self.sample(func, field_grid_cache.create(key, self.shape + (3,))))
+        else:
+            self.values = self.sample(func, np.empty(self.shape + (3,)))
+
+        self.interpolator = RegularGridInterpolator(self.axes, self.values, bounds_error=False, fill_value=0.0)
+
+    def sample(self, func, values):
+        flat_values = values.reshape(-1, 3)
+        for start in range(0, len(flat_values), self.chunk_size):
+            indices = np.unravel_index(np.arange(start, min(start + self.chunk_size, len(flat_values))), self.shape)
+            points = np.stack([axis[index] for axis, index in zip(self.axes, indices)], axis=1)
+            flat_values[start:start + len(points)] = evaluate_field(func, points)
+        return values
+
+    def contains(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        return np.all([(points[:, i] >= axis[0]) & (points[:, i] <= axis[-1]) for i, axis in enumerate(self.axes)], axis=0)
+
+    def get_func(self, direction=1):
+        # direction=-1 follows the field backwards, for tracing lines upstream
+        def batch(points):
+            return direction * self.interpolator(np.asarray(points, dtype=float).reshape(-1, 3))
+
+        def func(point):
+            return batch(point)[0]
+
+        func.batch = batch
+        return func
+
+class LevitatingSuperconductor(GlyphCacheScene, ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=65 * DEGREES, theta=-60 * DEGREES)
 
-        self.play(temprature_value.animate.set_value(0.5 - 1e-6), run_time=5)
-        self.play(Transform(magnet_vector_field, flow_line_curvy_arrows))
+        bar_magnet = draw_bar_magnet()
+        superconductor = Prism(dimensions=[1.5, 1.0, 0.3], fill_color=GOLD, fill_opacity=0.8, stroke_width=0).shift(1.5 * OUT)
 
-        self.play(temprature_value.animate.set_value(0.1), run_time=2)
+        self.play(FadeIn(bar_magnet))
+        self.play(Create(superconductor))
 
         self.wait()
 
-        first_flux_tube = Rectangle(height=0.5, width=0.2, color=RED, fill_opacity=0.5).move_to((magnet_width/2 - (line_spacing * 3) - line_spacing/2) * LEFT + (magnet_position + 2) * UP).set_z_index(15)
-        second_flux_tube = Rectangle(height=0.5, width=0.2, color=RED, fill_opacity=0.5).move_to((magnet_width/2 - (line_spacing * 5) - line_spacing/2) * LEFT + (magnet_position + 2) * UP).set_z_index(15)
-        
-        create_flux_tubes = AnimationGroup(
-            Create(first_flux_tube),
-            Create(second_flux_tube)
-        )
+        # About 270k samples around the magnet, sampled and cached a chunk at a time
+        func = get_force_field_func(BarMagnetSource.from_bar_magnet(bar_magnet))
+        field_volume = FieldVolume(func, x_range=[-4.8, 4.8], y_range=[-2.4, 2.4], z_range=[-2.4, 3.2], step=0.1)
 
-        self.play(create_flux_tubes)
+        # Field lines are seeded on rings around the magnet's middle and traced both
+        # ways, down to the south face and back up to the north face
+        seeds = [
+            bar_magnet.get_center() + ring_radius * (np.cos(angle) * UP + np.sin(angle) * OUT)
+            for ring_radius in (0.8, 1.3, 1.9)
+            for angle in np.linspace(0, TAU, 10, endpoint=False)
+        ]
 
-        flux_tube_label = Text("Flux Tubes", color=RED).scale(0.5).next_to(first_flux_tube, 1.25 * LEFT)
+        trace_kwargs = dict(max_length=8, max_step=0.1, stop_func=lambda points: ~field_volume.contains(points))
+        downstream = trace_streamlines(field_volume.get_func(), seeds, **trace_kwargs)
+        upstream = trace_streamlines(field_volume.get_func(direction=-1), seeds, **trace_kwargs)
 
-        self.play(Write(flux_tube_label))
+        flow_lines = VGroup(*[
+            VMobject(color=BLUE, stroke_width=2, stroke_opacity=0.8).set_points(
+                fit_bezier_path(np.concatenate([backward[::-1], forward[1:]]))
+            )
+            for forward, backward in zip(downstream, upstream)
+        ])
 
-        self.wait()
+        self.play(Create(flow_lines), run_time=3)
 
-        flux_tube_fade_out = AnimationGroup(
-            FadeOut(first_flux_tube),
-            FadeOut(second_flux_tube),
-            FadeOut(flux_tube_label),
+        # Pinned flux holds the superconductor in place, it only bobs slightly
+        levitation_time = ValueTracker(0)
+        superconductor.add_updater(
+            lambda mobject: mobject.move_to((1.5 + 0.05 * np.sin(2 * levitation_time.get_value())) * OUT)
         )
 
-        self.play(flux_tube_fade_out)
-
-        self.wait()
-
-        self.play(temprature_value.animate.set_value(0.5 + 1e-6), run_time=2)
-        
-        self.play(Transform(magnet_vector_field, flow_line_arrows))
-        self.play(temprature_value.animate.set_value(3), run_time=5)
+        self.begin_ambient_camera_rotation(rate=0.3)
+        self.play(levitation_time.animate.set_value(12), run_time=12, rate_func=linear)
+        self.stop_ambient_camera_rotation()
 
         self.wait()